@@ -0,0 +1,65 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+import _isEqual from "lodash/isEqual";
+import { serializeQueryState, withHiddenParam } from "./queryState";
+
+// keys of the query state which do not change the aggregations
+const RESULTS_ONLY_KEYS = ["page", "size", "sortBy", "sortOrder"];
+
+const aggregationsKey = (queryState) =>
+  serializeQueryState(
+    RESULTS_ONLY_KEYS.reduce(
+      (state, key) => ({ ...state, [key]: undefined }),
+      queryState
+    )
+  );
+
+/**
+ * Search API reusing the aggregations of the previous query.
+ *
+ * When a query only changes the page, its size or the sorting of the previous
+ * one, the `skipAggregations` query parameter is sent and the previous
+ * aggregations are returned, as the same object, so that the facets are not
+ * re-rendered.
+ */
+export class AggregationsReusingSearchApi {
+  constructor(searchApi, { param, value }) {
+    this.searchApi = searchApi;
+    this.skipAggregations = [param, value];
+    this.previous = null;
+    this.search = this.search.bind(this);
+  }
+
+  get http() {
+    return this.searchApi.http;
+  }
+
+  get responseSerializer() {
+    return this.searchApi.responseSerializer;
+  }
+
+  async search(queryState) {
+    const skipping = (queryState.hiddenParams || []).some((param) =>
+      _isEqual(param, this.skipAggregations)
+    );
+    if (skipping) {
+      return this.searchApi.search(queryState);
+    }
+
+    const key = aggregationsKey(queryState);
+    const previous = this.previous;
+    if (previous && previous.key === key) {
+      const response = await this.searchApi.search(
+        withHiddenParam(queryState, this.skipAggregations)
+      );
+      return { ...response, aggregations: previous.aggregations };
+    }
+
+    const response = await this.searchApi.search(queryState);
+    this.previous = { key, aggregations: response.aggregations };
+    return response;
+  }
+}
@@ -0,0 +1,74 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+import { serializeQueryState } from "./queryState";
+
+const isPrivate = (response) => {
+  const cacheControl = (response.headers || {})["cache-control"] || "";
+  return /\b(private|no-store)\b/.test(cacheControl);
+};
+
+/**
+ * Search API keeping the latest responses in memory.
+ *
+ * Responses are kept in a LRU cache keyed by the normalized query state, with
+ * a maximum number of entries and a time to live (in seconds). As soon as the
+ * backend marks a response as private (`Cache-Control: private` or
+ * `no-store`), the cache is cleared and disabled.
+ *
+ * As the search endpoints do not mark the responses of authenticated users as
+ * private, the server also disables the cache in their pages (see
+ * `SEARCH_UI_RESPONSE_CACHE`).
+ */
+export class CachingSearchApi {
+  constructor(searchApi, { maxEntries = 50, ttl = 300 } = {}) {
+    this.searchApi = searchApi;
+    this.maxEntries = maxEntries;
+    this.ttl = ttl * 1000;
+    this.cache = new Map();
+    this.enabled = true;
+    this.search = this.search.bind(this);
+
+    if (searchApi.http) {
+      searchApi.http.interceptors.response.use((response) => {
+        if (isPrivate(response)) {
+          this.enabled = false;
+          this.cache.clear();
+        }
+        return response;
+      });
+    }
+  }
+
+  get http() {
+    return this.searchApi.http;
+  }
+
+  get responseSerializer() {
+    return this.searchApi.responseSerializer;
+  }
+
+  async search(queryState) {
+    const key = serializeQueryState(queryState);
+    const entry = this.cache.get(key);
+    if (entry) {
+      this.cache.delete(key);
+      if (entry.expires > Date.now()) {
+        // most recently used entries are last
+        this.cache.set(key, entry);
+        return entry.response;
+      }
+    }
+
+    const response = await this.searchApi.search(queryState);
+    if (this.enabled) {
+      this.cache.set(key, { response, expires: Date.now() + this.ttl });
+      if (this.cache.size > this.maxEntries) {
+        this.cache.delete(this.cache.keys().next().value);
+      }
+    }
+    return response;
+  }
+}
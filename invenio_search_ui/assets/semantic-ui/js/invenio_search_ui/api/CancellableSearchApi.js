@@ -0,0 +1,104 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+// weight of the latest request in the latency moving average
+const LATENCY_SMOOTHING = 0.3;
+
+// promise of a superseded query, which must neither render nor fail
+const superseded = () => new Promise(() => {});
+
+/**
+ * Search API dropping superseded queries.
+ *
+ * When a new query is issued, the HTTP request of the previous one is aborted
+ * (through an `AbortController` signal attached to the axios instance of the
+ * wrapped API) and its response is ignored, so that responses can never be
+ * rendered out of order.
+ *
+ * With `debounce` (`{ minDelay, maxDelay }` in milliseconds), a query issued
+ * while another one is in flight is delayed by half of the observed API
+ * latency (within the bounds), and dropped if another query is issued
+ * meanwhile.
+ */
+export class CancellableSearchApi {
+  constructor(searchApi, debounce = null) {
+    this.searchApi = searchApi;
+    this.debounce = debounce;
+    this.latency = null;
+    this.current = null;
+    this.inFlight = 0;
+    this.signal = null;
+    this.search = this.search.bind(this);
+
+    if (searchApi.http) {
+      // synchronous, so that the signal of the issuing query is attached
+      searchApi.http.interceptors.request.use(
+        (config) => (this.signal ? { ...config, signal: this.signal } : config),
+        null,
+        { synchronous: true }
+      );
+    }
+  }
+
+  get http() {
+    return this.searchApi.http;
+  }
+
+  get responseSerializer() {
+    return this.searchApi.responseSerializer;
+  }
+
+  get delay() {
+    const { minDelay = 0, maxDelay = 0 } = this.debounce || {};
+    if (!this.inFlight || this.latency === null) {
+      return this.inFlight ? minDelay : 0;
+    }
+    return Math.min(maxDelay, Math.max(minDelay, this.latency / 2));
+  }
+
+  wait(query, delay) {
+    return new Promise((resolve) => setTimeout(resolve, delay)).then(
+      () => this.current === query
+    );
+  }
+
+  async search(queryState) {
+    if (this.current) {
+      this.current.controller.abort();
+    }
+    const query = { controller: new AbortController() };
+    this.current = query;
+
+    const delay = this.delay;
+    if (delay > 0 && !(await this.wait(query, delay))) {
+      return superseded();
+    }
+
+    const start = Date.now();
+    this.inFlight += 1;
+    let response;
+    try {
+      this.signal = query.controller.signal;
+      const request = this.searchApi.search(queryState);
+      this.signal = null;
+      response = await request;
+    } catch (error) {
+      if (this.current !== query) {
+        return superseded();
+      }
+      throw error;
+    } finally {
+      this.signal = null;
+      this.inFlight -= 1;
+    }
+
+    const latency = Date.now() - start;
+    this.latency =
+      this.latency === null
+        ? latency
+        : LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * this.latency;
+    return this.current === query ? response : superseded();
+  }
+}
@@ -0,0 +1,94 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+import { whenIdle } from "../scheduling";
+import { serializeQueryState } from "./queryState";
+
+/**
+ * Search API prefetching the pages around the current one.
+ *
+ * Once a page is fetched and the browser is idle, the `next` (and
+ * `previous`) pages of the same query are requested and kept until the user
+ * navigates to one of them. Pages beyond `maxTotalResults` are never
+ * requested. The prefetched pages are dropped as soon as another query is
+ * issued.
+ *
+ * Each page is requested with its own search API, created by
+ * `createPrefetchApi`, as an `InvenioSearchApi` cancels its previous request
+ * when a new one is issued: prefetching with the wrapped search API would
+ * cancel the other prefetches and the requests of the app.
+ */
+export class PagePrefetchingSearchApi {
+  constructor(
+    searchApi,
+    { next = 1, previous = 0 } = {},
+    maxTotalResults,
+    createPrefetchApi
+  ) {
+    this.searchApi = searchApi;
+    this.next = next;
+    this.previous = previous;
+    this.maxTotalResults = maxTotalResults;
+    this.createPrefetchApi = createPrefetchApi;
+    this.pages = new Map();
+    this.cancelPrefetch = () => {};
+    this.search = this.search.bind(this);
+  }
+
+  get http() {
+    return this.searchApi.http;
+  }
+
+  get responseSerializer() {
+    return this.searchApi.responseSerializer;
+  }
+
+  async search(queryState) {
+    const prefetched = this.pages.get(serializeQueryState(queryState));
+    this.pages = new Map();
+    this.cancelPrefetch();
+
+    const response =
+      (prefetched && (await prefetched)) ||
+      (await this.searchApi.search(queryState));
+    this.cancelPrefetch = whenIdle(() => this.prefetch(queryState, response));
+    return response;
+  }
+
+  prefetch(queryState, response) {
+    const { page = 1, size } = queryState;
+    if (!size || !response || typeof response.total !== "number") {
+      return;
+    }
+    const total = this.maxTotalResults
+      ? Math.min(response.total, this.maxTotalResults)
+      : response.total;
+    const lastPage = Math.ceil(total / size);
+
+    const pages = [];
+    for (let offset = 1; offset <= this.next; offset++) {
+      pages.push(page + offset);
+    }
+    for (let offset = 1; offset <= this.previous; offset++) {
+      pages.push(page - offset);
+    }
+    for (const target of pages) {
+      if (target < 1 || target > lastPage) {
+        continue;
+      }
+      const pageState = { ...queryState, page: target };
+      const key = serializeQueryState(pageState);
+      if (!this.pages.has(key)) {
+        // a failed prefetch is fetched again on navigation
+        this.pages.set(
+          key,
+          this.createPrefetchApi()
+            .search(pageState)
+            .catch(() => null)
+        );
+      }
+    }
+  }
+}
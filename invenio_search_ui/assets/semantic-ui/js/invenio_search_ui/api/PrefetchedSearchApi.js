@@ -0,0 +1,43 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+import { serializeQueryState } from "./queryState";
+
+/**
+ * Search API answering the first query with a response embedded in the page.
+ *
+ * The server runs the initial query of the search app and embeds
+ * `{ query, response }` next to the search app configuration. If the first
+ * query issued by react-searchkit matches it, the response is used instead
+ * of fetching it again. Any other query is delegated to the wrapped API.
+ */
+export class PrefetchedSearchApi {
+  constructor(searchApi, prefetched) {
+    this.searchApi = searchApi;
+    this.prefetched = prefetched;
+    this.search = this.search.bind(this);
+  }
+
+  get http() {
+    return this.searchApi.http;
+  }
+
+  get responseSerializer() {
+    return this.searchApi.responseSerializer;
+  }
+
+  async search(queryState) {
+    const prefetched = this.prefetched;
+    // the embedded response is only valid for the first query
+    this.prefetched = null;
+    if (
+      prefetched &&
+      serializeQueryState(queryState) === serializeQueryState(prefetched.query)
+    ) {
+      return this.responseSerializer.serialize(prefetched.response);
+    }
+    return this.searchApi.search(queryState);
+  }
+}
@@ -0,0 +1,60 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+import { serializeQueryState, withHiddenParam } from "./queryState";
+
+/**
+ * Search API fetching the hits first, and the aggregations afterwards.
+ *
+ * A query is first sent with the `skipAggregations` query parameter, and
+ * resolved with the hits only. The aggregations are then fetched in a
+ * follow-up request, and passed to the subscribers (see
+ * `AggregationsFollowUp`) as `{ queryKey, loading, aggregations }`.
+ *
+ * The follow-up requests are sent with their own search API (`followUpApi`),
+ * so that they do not cancel, nor get cancelled by, the other requests.
+ */
+export class ProgressiveSearchApi {
+  constructor(searchApi, { param, value }, followUpApi) {
+    this.searchApi = searchApi;
+    this.skipAggregations = [param, value];
+    this.followUpApi = followUpApi;
+    this.listeners = new Set();
+    this.search = this.search.bind(this);
+  }
+
+  get http() {
+    return this.searchApi.http;
+  }
+
+  get responseSerializer() {
+    return this.searchApi.responseSerializer;
+  }
+
+  subscribe(listener) {
+    this.listeners.add(listener);
+    return () => this.listeners.delete(listener);
+  }
+
+  notify(event) {
+    this.listeners.forEach((listener) => listener(event));
+  }
+
+  async search(queryState) {
+    const queryKey = serializeQueryState(queryState);
+    const response = await this.searchApi.search(
+      withHiddenParam(queryState, this.skipAggregations)
+    );
+    this.notify({ queryKey, loading: true });
+    // the aggregations do not depend on the page, nor on its size
+    this.followUpApi
+      .search({ ...queryState, page: 1, size: 1 })
+      .then(({ aggregations }) =>
+        this.notify({ queryKey, loading: false, aggregations })
+      )
+      .catch(() => this.notify({ queryKey, loading: false }));
+    return response;
+  }
+}
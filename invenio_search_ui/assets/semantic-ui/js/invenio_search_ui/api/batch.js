@@ -0,0 +1,125 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+import axios from "axios";
+
+// queued requests, per batch endpoint
+const queues = new Map();
+
+const sendRequest = (config) =>
+  axios.getAdapter(axios.defaults.adapter)(config);
+
+// headers of a request, as a plain object
+const requestHeaders = ({ headers }) => {
+  const plain = headers && headers.toJSON ? headers.toJSON() : { ...headers };
+  return Object.fromEntries(
+    Object.entries(plain).filter(([, value]) => typeof value === "string")
+  );
+};
+
+// reject a queued request as soon as it is cancelled
+const onCancel = (entry) => {
+  const { config } = entry;
+  const cancel = (reason) => {
+    entry.cancelled = true;
+    entry.reject(reason);
+  };
+  if (config.signal) {
+    const abort = () => cancel(new axios.CanceledError(null, null, config));
+    if (config.signal.aborted) {
+      abort();
+    } else {
+      config.signal.addEventListener("abort", abort, { once: true });
+    }
+  }
+  if (config.cancelToken) {
+    config.cancelToken.promise.then(cancel);
+  }
+};
+
+const flush = (batchUrl) => {
+  const queue = queues.get(batchUrl).filter(({ cancelled }) => !cancelled);
+  queues.delete(batchUrl);
+  const fallback = (entry) => {
+    if (!entry.cancelled) {
+      sendRequest(entry.config).then(entry.resolve, entry.reject);
+    }
+  };
+
+  if (queue.length === 0) {
+    return;
+  }
+  if (queue.length === 1) {
+    fallback(queue[0]);
+    return;
+  }
+  axios
+    .post(
+      batchUrl,
+      {
+        queries: queue.map(({ config }) => ({
+          url: axios.getUri(config),
+          headers: requestHeaders(config),
+        })),
+      },
+      { withCredentials: queue.some(({ config }) => config.withCredentials) }
+    )
+    .then(({ data }) => {
+      queue.forEach((entry, idx) => {
+        if (entry.cancelled) {
+          return;
+        }
+        const response = (data.responses || [])[idx];
+        if (!response || response.status >= 400) {
+          fallback(entry);
+          return;
+        }
+        entry.resolve({
+          data: response.body,
+          status: response.status,
+          statusText: "",
+          headers: {},
+          config: entry.config,
+          request: null,
+        });
+      });
+    })
+    .catch(() => queue.forEach(fallback));
+};
+
+/**
+ * Send the next request of an axios instance through a batch endpoint.
+ *
+ * The requests issued in the same tick for the same batch endpoint (e.g. the
+ * initial queries of the search apps of a page) are sent as a single POST
+ * request of `{ queries: [{ url, headers }] }`, answered with
+ * `{ responses: [{ status, body }] }` in the same order. Requests failing in
+ * the batch, or all of them if the batch request fails, are sent
+ * individually.
+ *
+ * Each query comes with all the headers of its request (e.g. `Accept` and
+ * the `headers` of the search API configuration), which the endpoint must
+ * apply to it. The headers set by the browser (e.g. `Accept-Language`) and
+ * the cookies are the ones of the batch request. Requests cancelled (with `signal` or `cancelToken`) while queued
+ * are rejected right away, and left out of the batch.
+ * @function
+ * @param {object} http - axios instance of a search API.
+ * @param {string} batchUrl - URL of the batch endpoint.
+ */
+export const batchNextRequest = (http, batchUrl) => {
+  const adapter = http.defaults.adapter;
+  http.defaults.adapter = (config) => {
+    http.defaults.adapter = adapter;
+    return new Promise((resolve, reject) => {
+      if (!queues.has(batchUrl)) {
+        queues.set(batchUrl, []);
+        setTimeout(() => flush(batchUrl), 0);
+      }
+      const entry = { config, resolve, reject, cancelled: false };
+      queues.get(batchUrl).push(entry);
+      onCancel(entry);
+    });
+  };
+};
@@ -0,0 +1,24 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+/**
+ * Decode a JSON search response.
+ *
+ * When `project` is set, only the keys read by react-searchkit's
+ * `InvenioResponseSerializer` (`aggregations` and `hits`) are kept, so that
+ * the unused ones (e.g. `links`) are not copied between threads.
+ * @function
+ * @param {ArrayBuffer} buffer - UTF-8 encoded response body.
+ * @param {boolean} project - keep only the serialized keys.
+ * @returns {object} the response body.
+ */
+export const decodeResponse = (buffer, project = false) => {
+  const data = JSON.parse(new TextDecoder().decode(buffer));
+  if (!project || data === null || typeof data !== "object") {
+    return data;
+  }
+  const { aggregations, hits } = data;
+  return { aggregations, hits };
+};
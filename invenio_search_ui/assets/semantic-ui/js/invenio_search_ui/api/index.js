@@ -0,0 +1,128 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+import _get from "lodash/get";
+import { InvenioSearchApi } from "react-searchkit";
+import { AggregationsReusingSearchApi } from "./AggregationsReusingSearchApi";
+import { batchNextRequest } from "./batch";
+import { decodeResponsesInWorker } from "./worker";
+import { CachingSearchApi } from "./CachingSearchApi";
+import { CancellableSearchApi } from "./CancellableSearchApi";
+import { PagePrefetchingSearchApi } from "./PagePrefetchingSearchApi";
+import { PrefetchedSearchApi } from "./PrefetchedSearchApi";
+import { ProgressiveSearchApi } from "./ProgressiveSearchApi";
+
+/**
+ * Decode the responses of a search API in a worker, if configured.
+ * @function
+ * @param {object} searchApi - `InvenioSearchApi` instance.
+ * @param {object} config - search app configuration.
+ */
+const withResponseWorker = (searchApi, config) => {
+  if (config.responseWorker) {
+    // with a custom serializer, any key of the response might be read
+    const project = !_get(config.searchApi, "invenio.responseSerializer");
+    decodeResponsesInWorker(searchApi.http, project);
+  }
+};
+
+/**
+ * Create a search API sending its requests independently of the app ones.
+ *
+ * An `InvenioSearchApi` cancels its previous request when a new one is
+ * issued, so the requests which must not supersede (or be superseded by) the
+ * app queries, e.g. prefetches, are sent with their own instance.
+ * @function
+ * @param {object} config - search app configuration.
+ * @returns {object} react-searchkit compatible search API.
+ */
+export const createSideSearchApi = (config) => {
+  const searchApi = new InvenioSearchApi(config.searchApi);
+  withResponseWorker(searchApi, config);
+  return searchApi;
+};
+
+/**
+ * Create the search API of a search app.
+ * @function
+ * @param {object} config - search app configuration.
+ * @param {object} prefetched - response of the initial query embedded in the page.
+ * @returns {object} react-searchkit compatible search API.
+ */
+export const createSearchApi = (config, prefetched = null) => {
+  // responses caching and aggregations reuse
+  const withResponseReuse = (searchApi) => {
+    if (config.responseCache) {
+      searchApi = new CachingSearchApi(searchApi, config.responseCache);
+    }
+    if (config.reuseAggregations) {
+      searchApi = new AggregationsReusingSearchApi(
+        searchApi,
+        config.searchApi.skipAggregations
+      );
+    }
+    return searchApi;
+  };
+
+  let searchApi = new InvenioSearchApi(config.searchApi);
+  withResponseWorker(searchApi, config);
+  if (config.batchSearch) {
+    // only the initial queries of the apps of a page are batched
+    batchNextRequest(searchApi.http, config.batchSearch.url);
+  }
+  searchApi = withResponseReuse(searchApi);
+  if (config.progressiveSearch) {
+    searchApi = new ProgressiveSearchApi(
+      searchApi,
+      config.searchApi.skipAggregations,
+      withResponseReuse(createSideSearchApi(config))
+    );
+  }
+  const { prefetchPages, maxTotalResults } = config.paginationOptions || {};
+  if (prefetchPages) {
+    searchApi = new PagePrefetchingSearchApi(
+      searchApi,
+      prefetchPages,
+      maxTotalResults,
+      () => createSideSearchApi(config)
+    );
+  }
+  searchApi = new CancellableSearchApi(searchApi, config.requestDebounce);
+  if (prefetched) {
+    searchApi = new PrefetchedSearchApi(searchApi, prefetched);
+  }
+  return searchApi;
+};
+
+/**
+ * Find a search API of a given class among the wrapped ones.
+ * @function
+ * @param {object} searchApi - search API, as created by `createSearchApi`.
+ * @param {function} cls - class of the search API.
+ * @returns {object} the search API, or `null` if not used.
+ */
+export const findSearchApi = (searchApi, cls) => {
+  let current = searchApi;
+  while (current && !(current instanceof cls)) {
+    current = current.searchApi;
+  }
+  return current || null;
+};
+
+export {
+  AggregationsReusingSearchApi,
+  CachingSearchApi,
+  CancellableSearchApi,
+  PagePrefetchingSearchApi,
+  PrefetchedSearchApi,
+  ProgressiveSearchApi,
+};
+export { batchNextRequest } from "./batch";
+export { decodeResponsesInWorker } from "./worker";
+export {
+  normalizeQueryState,
+  serializeQueryState,
+  withHiddenParam,
+} from "./queryState";
@@ -0,0 +1,60 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+import _isEmpty from "lodash/isEmpty";
+import _isNil from "lodash/isNil";
+import _isNumber from "lodash/isNumber";
+import _pick from "lodash/pick";
+
+const QUERY_STATE_KEYS = [
+  "queryString",
+  "sortBy",
+  "sortOrder",
+  "page",
+  "size",
+  "filters",
+  "hiddenParams",
+];
+
+/**
+ * Normalize a query state to the keys sent to the search API.
+ * @function
+ * @param {object} queryState - react-searchkit query state.
+ * @returns {object} query state without UI-only keys and empty values.
+ */
+export const normalizeQueryState = (queryState = {}) => {
+  const picked = _pick(queryState, QUERY_STATE_KEYS);
+  return Object.keys(picked)
+    .sort()
+    .reduce((normalized, key) => {
+      const value = picked[key];
+      if (_isNil(value) || (!_isNumber(value) && _isEmpty(value))) {
+        return normalized;
+      }
+      normalized[key] = value;
+      return normalized;
+    }, {});
+};
+
+/**
+ * Serialize a query state to a stable string.
+ * @function
+ * @param {object} queryState - react-searchkit query state.
+ * @returns {string} key identifying the query.
+ */
+export const serializeQueryState = (queryState) =>
+  JSON.stringify(normalizeQueryState(queryState));
+
+/**
+ * Add a hidden (i.e. not displayed) query parameter to a query state.
+ * @function
+ * @param {object} queryState - react-searchkit query state.
+ * @param {array} param - `[name, value]` pair.
+ * @returns {object} new query state.
+ */
+export const withHiddenParam = (queryState, param) => ({
+  ...queryState,
+  hiddenParams: [...(queryState.hiddenParams || []), param],
+});
@@ -0,0 +1,16 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+// Decodes the search responses off the main thread, see `worker.js`.
+
+import { decodeResponse } from "./decode";
+
+self.onmessage = ({ data: { id, buffer, project } }) => {
+  try {
+    self.postMessage({ id, result: decodeResponse(buffer, project) });
+  } catch (error) {
+    self.postMessage({ id, error: error.message });
+  }
+};
@@ -0,0 +1,104 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+import { decodeResponse } from "./decode";
+
+// `null` until first used, `false` if the worker is not available
+let worker = null;
+let nextId = 0;
+const pending = new Map();
+
+const failWorker = (error) => {
+  if (worker) {
+    worker.terminate();
+  }
+  // the next responses are decoded on the main thread
+  worker = false;
+  // the buffers of the pending responses were transferred to the worker
+  pending.forEach(({ reject }) => reject(error));
+  pending.clear();
+};
+
+const getWorker = () => {
+  if (worker === null) {
+    try {
+      worker = new Worker(new URL("./responseWorker.js", import.meta.url));
+    } catch (error) {
+      // e.g. forbidden by the Content Security Policy
+      worker = false;
+      return worker;
+    }
+    worker.onmessage = ({ data: { id, result, error } }) => {
+      const { resolve, reject } = pending.get(id);
+      pending.delete(id);
+      error ? reject(new Error(error)) : resolve(result);
+    };
+    worker.onerror = (event) => {
+      event.preventDefault();
+      failWorker(new Error(event.message || "The response worker failed."));
+    };
+    worker.onmessageerror = () =>
+      failWorker(new Error("The response worker sent an invalid message."));
+  }
+  return worker;
+};
+
+const decodeInWorker = (buffer, project) =>
+  new Promise((resolve, reject) => {
+    const target = getWorker();
+    if (!target) {
+      resolve(decodeResponse(buffer, project));
+      return;
+    }
+    const id = nextId++;
+    pending.set(id, { resolve, reject });
+    // the buffer is transferred, not copied
+    target.postMessage({ id, buffer, project }, [buffer]);
+  });
+
+/**
+ * Decode the responses of an axios instance in a Web Worker.
+ *
+ * The responses are received as `ArrayBuffer`s, transferred to a (shared)
+ * worker which decodes and parses them, so that large responses do not block
+ * the main thread. Error responses are decoded on the main thread. Where Web
+ * Workers are not available (e.g. jsdom), the axios instance is left as is.
+ *
+ * If the worker cannot be started or fails, the responses it was decoding
+ * are rejected and the next ones are decoded on the main thread.
+ *
+ * The parsed response is copied back to the main thread, so with `project`
+ * (for the default `InvenioResponseSerializer`) only the keys read by the
+ * serializer are kept in the worker.
+ * @function
+ * @param {object} http - axios instance of a search API.
+ * @param {boolean} project - keep only the keys read by the serializer.
+ */
+export const decodeResponsesInWorker = (http, project = false) => {
+  if (typeof Worker === "undefined" || typeof TextDecoder === "undefined") {
+    return;
+  }
+  http.defaults.responseType = "arraybuffer";
+  http.defaults.transformResponse = [(data) => data];
+  http.interceptors.response.use(
+    (response) =>
+      response.data instanceof ArrayBuffer
+        ? decodeInWorker(response.data, project).then((data) => ({
+            ...response,
+            data,
+          }))
+        : response,
+    (error) => {
+      if (error.response && error.response.data instanceof ArrayBuffer) {
+        try {
+          error.response.data = decodeResponse(error.response.data);
+        } catch (e) {
+          error.response.data = {};
+        }
+      }
+      return Promise.reject(error);
+    }
+  );
+};
@@ -0,0 +1,67 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+import PropTypes from "prop-types";
+import { useEffect } from "react";
+import { useStore } from "react-redux";
+import { currentQueryKey, updateAggregations } from "./resultsState";
+
+/**
+ * Merge the aggregations fetched after the hits in the react-searchkit state.
+ *
+ * Must be rendered within `ReactSearchKit`. The aggregations are kept pending
+ * until react-searchkit has stored the hits of their query, as storing the
+ * hits replaces the aggregations. Aggregations of a query which is not the
+ * current one anymore are ignored.
+ */
+export const AggregationsFollowUp = ({ searchApi, onLoading }) => {
+  const store = useStore();
+  useEffect(() => {
+    let pending = null;
+
+    const apply = () => {
+      if (pending === null) {
+        return;
+      }
+      if (currentQueryKey(store) !== pending.queryKey) {
+        pending = null;
+        return;
+      }
+      if (store.getState().results.loading) {
+        // the hits are not stored yet
+        return;
+      }
+      const { aggregations } = pending;
+      pending = null;
+      updateAggregations(store, () => aggregations);
+      onLoading(false);
+    };
+
+    const unsubscribeStore = store.subscribe(apply);
+    const unsubscribeApi = searchApi.subscribe(
+      ({ queryKey, loading, aggregations }) => {
+        if (currentQueryKey(store) !== queryKey) {
+          return;
+        }
+        if (aggregations) {
+          pending = { queryKey, aggregations };
+          apply();
+        } else {
+          onLoading(loading);
+        }
+      }
+    );
+    return () => {
+      unsubscribeApi();
+      unsubscribeStore();
+    };
+  }, [searchApi, store, onLoading]);
+  return null;
+};
+
+AggregationsFollowUp.propTypes = {
+  searchApi: PropTypes.object.isRequired,
+  onLoading: PropTypes.func.isRequired,
+};
@@ -24,6 +24,28 @@ const resultRenderer = ({ text }, queryString) => {
   );
 };
 
+/**
+ * Re-render a component once the translations of the page are loaded.
+ *
+ * The search bars can be mounted on their own (e.g. in the header), before
+ * the translations of the page language are loaded.
+ */
+const rerenderOnLanguageChange = (component) => {
+  const rerender = () => component.forceUpdate();
+  i18next.on("languageChanged", rerender);
+  return () => i18next.off("languageChanged", rerender);
+};
+
+/**
+ * Default search option, translated in the current language.
+ */
+const getDefaultOption = (defaultOption) =>
+  defaultOption || {
+    key: "records",
+    text: i18next.t("All records"),
+    value: "/search",
+  };
+
 export class MultipleOptionsSearchBar extends Component {
   /** Multiple options searchbar to be used as a standalone component
    */
@@ -34,10 +56,19 @@ export class MultipleOptionsSearchBar extends Component {
     };
   }
 
+  componentDidMount() {
+    this.unsubscribeLanguage = rerenderOnLanguageChange(this);
+  }
+
+  componentWillUnmount() {
+    this.unsubscribeLanguage();
+  }
+
   handleOnSearchClick = () => {
     const { options, defaultOption } = this.props;
     const { queryString } = this.state;
-    let destinationURL = options[0]?.value || defaultOption.value;
+    let destinationURL =
+      options[0]?.value || getDefaultOption(defaultOption).value;
 
     window.location = `${destinationURL}?q=${queryString}`;
   };
@@ -53,7 +84,9 @@ export class MultipleOptionsSearchBar extends Component {
   };
 
   render() {
-    const { placeholder, options } = this.props;
+    const { options } = this.props;
+    const placeholder =
+      this.props.placeholder || i18next.t("Search records...");
     const { queryString } = this.state;
     const button = (
       <Button
@@ -96,22 +129,28 @@ MultipleOptionsSearchBar.propTypes = {
 };
 
 MultipleOptionsSearchBar.defaultProps = {
-  placeholder: i18next.t("Search records..."),
-  defaultOption: {
-    key: "records",
-    text: i18next.t("All records"),
-    value: "/search",
-  },
+  // translated when rendered
+  placeholder: null,
+  defaultOption: null,
 };
 
 export class MultipleOptionsSearchBarCmp extends Component {
   /** Multiple options searchbar to be wrapped with RSK context
    */
+  componentDidMount() {
+    this.unsubscribeLanguage = rerenderOnLanguageChange(this);
+  }
+
+  componentWillUnmount() {
+    this.unsubscribeLanguage();
+  }
+
   onBtnSearchClick = (e, data) => {
     const { result } = data || {};
     const { queryString, updateQueryState, currentQueryState } = this.props;
     const { defaultOption } = this.props;
-    const destinationURL = result?.value || defaultOption.value;
+    const destinationURL =
+      result?.value || getDefaultOption(defaultOption).value;
 
     if (window.location.pathname === destinationURL) {
       updateQueryState({ ...currentQueryState, queryString });
@@ -126,7 +165,9 @@ export class MultipleOptionsSearchBarCmp extends Component {
   };
 
   render() {
-    const { placeholder, queryString, options } = this.props;
+    const { queryString, options } = this.props;
+    const placeholder =
+      this.props.placeholder || i18next.t("Search records...");
     const button = (
       <Button
         icon
@@ -172,12 +213,9 @@ MultipleOptionsSearchBarCmp.propTypes = {
 };
 
 MultipleOptionsSearchBarCmp.defaultProps = {
-  placeholder: i18next.t("Search records..."),
-  defaultOption: {
-    key: "records",
-    text: i18next.t("All records"),
-    value: "/search",
-  },
+  // translated when rendered
+  placeholder: null,
+  defaultOption: null,
 };
 
 export const MultipleOptionsSearchBarRSK = withState(
@@ -18,9 +18,36 @@ import { Grid } from "semantic-ui-react";
 import { SearchConfigurationContext } from "./context";
 import { i18next } from "@translations/invenio_search_ui/i18next";
 import { InvenioSearchPagination } from "./InvenioSearchPagination";
+import {
+  VirtualizedResultsGrid,
+  VirtualizedResultsList,
+} from "./VirtualizedResults";
 import { AppMedia } from "@js/invenio_theme/Media";
 
-export const Results = ({ currentResultsState = {} }) => {
+const VirtualizedResults = ({
+  currentQueryState,
+  currentResultsState,
+  layoutOptions,
+  onResultsRendered,
+}) => {
+  const layout =
+    layoutOptions.listView && layoutOptions.gridView
+      ? currentQueryState.layout
+      : layoutOptions.listView
+      ? "list"
+      : "grid";
+  const VirtualizedLayout =
+    layout === "grid" ? VirtualizedResultsGrid : VirtualizedResultsList;
+  return (
+    <VirtualizedLayout
+      results={currentResultsState.data.hits}
+      options={layoutOptions.virtualized}
+      onResultsRendered={onResultsRendered}
+    />
+  );
+};
+
+export const Results = ({ currentQueryState = {}, currentResultsState = {} }) => {
   const { total } = currentResultsState.data;
   const { sortOptions, layoutOptions, paginationOptions, buildUID } =
     useContext(SearchConfigurationContext);
@@ -43,7 +70,14 @@ export const Results = ({ currentResultsState = {} }) => {
         <Grid relaxed>
           <Grid.Row>
             <Grid.Column>
-              {multipleLayouts ? (
+              {layoutOptions.virtualized ? (
+                <VirtualizedResults
+                  currentQueryState={currentQueryState}
+                  currentResultsState={currentResultsState}
+                  layoutOptions={layoutOptions}
+                  onResultsRendered={handleResultsRendered}
+                />
+              ) : multipleLayouts ? (
                 <ResultsMultiLayout onResultsRendered={handleResultsRendered}/>
               ) : layoutOptions.listView ? (
                 <ResultsList onResultsRendered={handleResultsRendered}/>
@@ -9,12 +9,7 @@ import Overridable, {
   OverridableContext,
   overrideStore,
 } from "react-overridable";
-import {
-  InvenioSearchApi,
-  ReactSearchKit,
-  withState,
-  buildUID,
-} from "react-searchkit";
+import { ReactSearchKit, withState, buildUID } from "react-searchkit";
 import { GridResponsiveSidebarColumn } from "react-invenio-forms";
 import { Container, Grid, Button } from "semantic-ui-react";
 import { ResultOptions } from "./Results";
@@ -24,12 +19,16 @@ import { i18next } from "@translations/invenio_search_ui/i18next";
 import _isEmpty from "lodash/isEmpty";
 import { SearchAppFacets } from "./SearchAppFacets";
 import { SearchAppResultsPane } from "./SearchAppResultsPane";
+import { createSearchApi, findSearchApi, ProgressiveSearchApi } from "../api";
+import { AggregationsFollowUp } from "./AggregationsFollowUp";
 
 const ResultOptionsWithState = withState(ResultOptions);
 
-export const SearchApp = ({ config, appName }) => {
+export const SearchApp = ({ config, appName, prefetched }) => {
   const [sidebarVisible, setSidebarVisible] = React.useState(false);
-  const searchApi = new InvenioSearchApi(config.searchApi);
+  const [searchApi] = React.useState(() => createSearchApi(config, prefetched));
+  const progressiveSearchApi = findSearchApi(searchApi, ProgressiveSearchApi);
+  const [aggregationsLoading, setAggregationsLoading] = React.useState(false);
   const context = {
     appName,
     buildUID: (element) => buildUID(element, "", appName),
@@ -79,6 +78,12 @@ export const SearchApp = ({ config, appName }) => {
             config.defaultSortingOnEmptyQueryString
           }
         >
+          {progressiveSearchApi && (
+            <AggregationsFollowUp
+              searchApi={progressiveSearchApi}
+              onLoading={setAggregationsLoading}
+            />
+          )}
           <Overridable
             id={buildUID("SearchApp.layout", "", appName)}
             config={config}
@@ -140,7 +145,12 @@ export const SearchApp = ({ config, appName }) => {
                       open={sidebarVisible}
                       onHideClick={() => setSidebarVisible(false)}
                     >
-                      <SearchAppFacets aggs={config.aggs} appName={appName} buildUID={buildUID}/>
+                      <SearchAppFacets
+                        aggs={config.aggs}
+                        appName={appName}
+                        buildUID={buildUID}
+                        loading={aggregationsLoading}
+                      />
                     </GridResponsiveSidebarColumn>
                   )}
 
@@ -197,17 +207,45 @@ SearchApp.propTypes = {
           value: PropTypes.number,
         })
       ),
+      maxTotalResults: PropTypes.number,
+      prefetchPages: PropTypes.shape({
+        next: PropTypes.number,
+        previous: PropTypes.number,
+      }),
     }),
     layoutOptions: PropTypes.shape({
       listView: PropTypes.bool.isRequired,
       gridView: PropTypes.bool.isRequired,
+      virtualized: PropTypes.shape({
+        itemHeight: PropTypes.number,
+        overscan: PropTypes.number,
+        itemsPerRow: PropTypes.number,
+      }),
     }).isRequired,
     defaultSortingOnEmptyQueryString: PropTypes.shape({
       sortBy: PropTypes.string,
       sortOrder: PropTypes.string,
     }),
+    responseCache: PropTypes.shape({
+      maxEntries: PropTypes.number,
+      ttl: PropTypes.number,
+    }),
+    requestDebounce: PropTypes.shape({
+      minDelay: PropTypes.number,
+      maxDelay: PropTypes.number,
+    }),
+    batchSearch: PropTypes.shape({
+      url: PropTypes.string.isRequired,
+    }),
+    responseWorker: PropTypes.bool,
+    progressiveSearch: PropTypes.bool,
+    reuseAggregations: PropTypes.bool,
   }).isRequired,
   appName: PropTypes.string,
+  prefetched: PropTypes.shape({
+    query: PropTypes.object.isRequired,
+    response: PropTypes.object.isRequired,
+  }),
 };
 
 SearchApp.defaultProps = {
@@ -228,4 +266,5 @@ SearchApp.defaultProps = {
     defaultSortingOnEmptyQueryString: {},
   },
   appName: null,
+  prefetched: null,
 };
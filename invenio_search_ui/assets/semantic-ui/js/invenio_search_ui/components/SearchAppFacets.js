@@ -6,18 +6,35 @@
 import React from "react";
 import { BucketAggregation, RangeFacet, buildUID } from "react-searchkit";
 import Overridable from "react-overridable";
+import { Placeholder } from "semantic-ui-react";
 
-export const SearchAppFacets = ({ aggs, appName }) => {
+const FacetPlaceholder = () => (
+  <Placeholder fluid className="rel-mb-2">
+    <Placeholder.Header>
+      <Placeholder.Line />
+    </Placeholder.Header>
+    <Placeholder.Paragraph>
+      <Placeholder.Line />
+      <Placeholder.Line />
+      <Placeholder.Line />
+    </Placeholder.Paragraph>
+  </Placeholder>
+);
+
+export const SearchAppFacets = ({ aggs, appName, loading }) => {
   const buildOverridableUID = (element) => buildUID(element, "", appName);
   return (
     <Overridable
       id={buildOverridableUID("SearchApp.facets", "", appName)}
       aggs={aggs}
       appName={appName}
+      loading={loading}
     >
       <>
         {aggs.map((agg) =>
-          agg.type === "date" ? (
+          loading ? (
+            <FacetPlaceholder key={agg.title} />
+          ) : agg.type === "date" ? (
             <RangeFacet
               key={agg.title}
               title={agg.title}
@@ -26,7 +43,7 @@ export const SearchAppFacets = ({ aggs, appName }) => {
             />
           ) : (
             <BucketAggregation key={agg.title} title={agg.title} agg={agg} />
-          ),
+          )
         )}
       </>
     </Overridable>
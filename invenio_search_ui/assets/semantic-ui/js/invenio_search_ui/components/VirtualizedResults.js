@@ -0,0 +1,221 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+import _chunk from "lodash/chunk";
+import PropTypes from "prop-types";
+import React, {
+  useCallback,
+  useContext,
+  useEffect,
+  useLayoutEffect,
+  useMemo,
+  useRef,
+  useState,
+} from "react";
+import Overridable from "react-overridable";
+import { Card, Item } from "semantic-ui-react";
+import { SearchConfigurationContext } from "./context";
+
+/**
+ * Render only the rows of a list near the viewport.
+ *
+ * Rows out of the rendered window are replaced by spacers, sized with the
+ * measured height of the rows (or the estimated one, for rows not rendered
+ * yet), so that the scroll position stays stable.
+ */
+const WindowedRows = ({
+  rows,
+  rowHeight,
+  overscan,
+  renderRow,
+  as: Container,
+  onRendered,
+}) => {
+  const containerRef = useRef(null);
+  const heights = useRef([]);
+  const [range, setRange] = useState([0, Math.min(rows.length, overscan * 2)]);
+
+  const heightOf = (index) => heights.current[index] || rowHeight;
+
+  const update = useCallback(() => {
+    const container = containerRef.current;
+    if (!container) {
+      return;
+    }
+    const viewStart = -container.getBoundingClientRect().top;
+    const viewEnd = viewStart + window.innerHeight;
+    let start = 0;
+    let offset = 0;
+    while (start < rows.length && offset + heightOf(start) < viewStart) {
+      offset += heightOf(start);
+      start += 1;
+    }
+    let end = start;
+    while (end < rows.length && offset < viewEnd) {
+      offset += heightOf(end);
+      end += 1;
+    }
+    start = Math.max(0, start - overscan);
+    end = Math.min(rows.length, end + overscan);
+    setRange((previous) =>
+      previous[0] === start && previous[1] === end ? previous : [start, end]
+    );
+  }, [rows, rowHeight, overscan]);
+
+  useEffect(() => {
+    heights.current = [];
+    update();
+    window.addEventListener("scroll", update, { passive: true });
+    window.addEventListener("resize", update);
+    return () => {
+      window.removeEventListener("scroll", update);
+      window.removeEventListener("resize", update);
+    };
+  }, [update]);
+
+  // measure the rendered rows, i.e. the children between the two spacers
+  useLayoutEffect(() => {
+    const children = containerRef.current.children;
+    for (let index = range[0]; index < range[1]; index++) {
+      const child = children[index - range[0] + 1];
+      if (child) {
+        heights.current[index] = child.getBoundingClientRect().height;
+      }
+    }
+  });
+
+  useEffect(() => {
+    onRendered && onRendered();
+  }, [rows]);
+
+  let before = 0;
+  for (let index = 0; index < range[0]; index++) {
+    before += heightOf(index);
+  }
+  let after = 0;
+  for (let index = range[1]; index < rows.length; index++) {
+    after += heightOf(index);
+  }
+
+  return (
+    <Container ref={containerRef}>
+      <div aria-hidden style={{ height: before }} />
+      {rows
+        .slice(range[0], range[1])
+        .map((row, idx) => renderRow(row, range[0] + idx))}
+      <div aria-hidden style={{ height: after }} />
+    </Container>
+  );
+};
+
+WindowedRows.propTypes = {
+  rows: PropTypes.array.isRequired,
+  rowHeight: PropTypes.number.isRequired,
+  overscan: PropTypes.number.isRequired,
+  renderRow: PropTypes.func.isRequired,
+  as: PropTypes.elementType,
+  onRendered: PropTypes.func,
+};
+
+WindowedRows.defaultProps = {
+  as: "div",
+  onRendered: null,
+};
+
+const resultKey = (result, index) => result.id || index;
+
+// same markup as `<Item.Group divided relaxed link>`, with a ref
+const ItemGroup = React.forwardRef((props, ref) => (
+  <div ref={ref} className="ui divided relaxed link items" {...props} />
+));
+
+/**
+ * Results list mounting only the items near the viewport.
+ *
+ * Each item is rendered with the overridable `ResultsList.item` component.
+ */
+export const VirtualizedResultsList = ({
+  results,
+  options,
+  onResultsRendered,
+}) => {
+  const { buildUID } = useContext(SearchConfigurationContext);
+  return (
+    <WindowedRows
+      rows={results}
+      rowHeight={options.itemHeight}
+      overscan={options.overscan}
+      as={ItemGroup}
+      onRendered={onResultsRendered}
+      renderRow={(result, index) => (
+        <Overridable
+          key={resultKey(result, index)}
+          id={buildUID("ResultsList.item")}
+          result={result}
+          index={index}
+        >
+          <Item />
+        </Overridable>
+      )}
+    />
+  );
+};
+
+/**
+ * Results grid mounting only the rows near the viewport.
+ *
+ * Each item is rendered with the overridable `ResultsGrid.item` component.
+ */
+export const VirtualizedResultsGrid = ({
+  results,
+  options,
+  onResultsRendered,
+}) => {
+  const { buildUID } = useContext(SearchConfigurationContext);
+  const rows = useMemo(
+    () => _chunk(results, options.itemsPerRow),
+    [results, options.itemsPerRow]
+  );
+  return (
+    <WindowedRows
+      rows={rows}
+      rowHeight={options.itemHeight}
+      overscan={options.overscan}
+      onRendered={onResultsRendered}
+      renderRow={(row, rowIndex) => (
+        <Card.Group key={rowIndex} itemsPerRow={options.itemsPerRow}>
+          {row.map((result, idx) => {
+            const index = rowIndex * options.itemsPerRow + idx;
+            return (
+              <Overridable
+                key={resultKey(result, index)}
+                id={buildUID("ResultsGrid.item")}
+                result={result}
+                index={index}
+              >
+                <Card />
+              </Overridable>
+            );
+          })}
+        </Card.Group>
+      )}
+    />
+  );
+};
+
+const virtualizedPropTypes = {
+  results: PropTypes.array.isRequired,
+  options: PropTypes.shape({
+    itemHeight: PropTypes.number.isRequired,
+    overscan: PropTypes.number.isRequired,
+    itemsPerRow: PropTypes.number.isRequired,
+  }).isRequired,
+  onResultsRendered: PropTypes.func,
+};
+
+VirtualizedResultsList.propTypes = virtualizedPropTypes;
+VirtualizedResultsGrid.propTypes = virtualizedPropTypes;
+VirtualizedResultsList.defaultProps = { onResultsRendered: null };
+VirtualizedResultsGrid.defaultProps = { onResultsRendered: null };
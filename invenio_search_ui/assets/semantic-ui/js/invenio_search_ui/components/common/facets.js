@@ -4,7 +4,14 @@
  */
 
 import { i18next } from "@translations/invenio_search_ui/i18next";
-import React, { useState } from "react";
+import React, {
+  useCallback,
+  useContext,
+  useEffect,
+  useMemo,
+  useRef,
+  useState,
+} from "react";
 import {
   Accordion,
   Button,
@@ -12,15 +19,43 @@ import {
   Checkbox,
   Label,
   List,
+  Loader,
 } from "semantic-ui-react";
 import Overridable from "react-overridable";
 import PropTypes from "prop-types";
 import {
   BucketAggregation,
+  InvenioSearchApi,
   Toggle,
   buildUID,
   RangeFacet,
+  withState,
 } from "react-searchkit";
+import { useStore } from "react-redux";
+import { serializeQueryState, withHiddenParam } from "../../api/queryState";
+import { SearchConfigurationContext } from "../context";
+import { currentQueryKey, updateAggregations } from "../resultsState";
+
+// nested facet fetched on demand, see `ContribLazyChildAgg`
+const LazyChildAggContext = React.createContext(null);
+
+/**
+ * Search API of the facets loaded on demand.
+ *
+ * It is not the search app API, so that the app queries are not superseded.
+ */
+const useFacetApi = () => {
+  const { searchApi } = useContext(SearchConfigurationContext);
+  return useMemo(() => new InvenioSearchApi(searchApi), [searchApi]);
+};
+
+// query of the facets of the current query state
+const facetsQuery = (queryState) => ({
+  ...queryState,
+  page: 1,
+  size: 1,
+  sortBy: null,
+});
 
 export const ContribSearchAppFacets = ({ aggs, toggle, help, appName }) => {
   return (
@@ -109,9 +144,18 @@ export const ContribParentFacetValue = ({
   isSelected,
   childAggCmps,
   onFilterClicked,
+  onExpand,
 }) => {
   const [isActive, setIsActive] = useState(false);
 
+  // on expansion, or when a new query resets the children of an expanded
+  // parent: `onExpand` must be stable across re-renders
+  useEffect(() => {
+    if (isActive && onExpand) {
+      onExpand();
+    }
+  }, [isActive, onExpand]);
+
   return (
     <Accordion>
       <Accordion.Title
@@ -160,6 +204,11 @@ ContribParentFacetValue.propTypes = {
   isSelected: PropTypes.bool.isRequired,
   childAggCmps: PropTypes.node.isRequired,
   onFilterClicked: PropTypes.func.isRequired,
+  onExpand: PropTypes.func,
+};
+
+ContribParentFacetValue.defaultProps = {
+  onExpand: null,
 };
 
 export const ContribFacetValue = ({
@@ -204,17 +253,33 @@ export const ContribBucketAggregationValuesElement = ({
   onFilterClicked,
   childAggCmps,
 }) => {
+  const lazyChildAgg = useContext(LazyChildAggContext);
   const hasChildren = childAggCmps && childAggCmps.props.buckets.length > 0;
+  const lazyChildren =
+    !hasChildren && lazyChildAgg && !lazyChildAgg.isLoaded(bucket.key);
   const keyField = bucket.key_as_string ? bucket.key_as_string : bucket.key;
+  // stable per bucket (and query), so that it is only run on expansion
+  const loadChildren = lazyChildAgg && lazyChildAgg.loadChildren;
+  const loadBucketChildren = useCallback(
+    () => loadChildren(bucket.key),
+    [loadChildren, bucket.key]
+  );
   return (
     <List.Item key={bucket.key}>
-      {hasChildren ? (
+      {hasChildren || lazyChildren ? (
         <ContribParentFacetValue
           bucket={bucket}
           keyField={keyField}
           isSelected={isSelected}
-          childAggCmps={childAggCmps}
+          childAggCmps={
+            hasChildren ? (
+              childAggCmps
+            ) : (
+              <Loader active inline="centered" size="mini" />
+            )
+          }
           onFilterClicked={onFilterClicked}
+          onExpand={lazyChildren ? loadBucketChildren : null}
         />
       ) : (
         <ContribFacetValue
@@ -239,6 +304,195 @@ ContribBucketAggregationValuesElement.defaultProps = {
   childAggCmps: null,
 };
 
+/**
+ * Buckets of a paged facet loaded on demand.
+ *
+ * The search response only contains the first buckets of the facet. "Show
+ * more" requests more buckets of this aggregation, with the same query and
+ * filters, through the query parameter declared in `agg.paging`.
+ */
+const ContribFacetMoreBucketsCmp = ({
+  agg,
+  currentQueryState,
+  currentResultsState,
+  selectedFilters,
+  updateQueryFilters,
+}) => {
+  const facetApi = useFacetApi();
+  const { size: pageSize, param } = agg.paging;
+  const query = facetsQuery(currentQueryState);
+  const queryKey = serializeQueryState(query);
+  const shown = (
+    currentResultsState.data.aggregations?.[agg.aggName]?.buckets || []
+  ).length;
+  const [state, setState] = useState({});
+  const current =
+    state.queryKey === queryKey
+      ? state
+      : { queryKey, buckets: [], exhausted: shown < pageSize, loading: false };
+
+  const showMore = () => {
+    const bucketsSize = shown + current.buckets.length + pageSize;
+    setState({ ...current, loading: true });
+    facetApi
+      .search(
+        withHiddenParam(query, [param || `${agg.aggName}_size`, bucketsSize])
+      )
+      .then(({ aggregations }) => {
+        const buckets = aggregations?.[agg.aggName]?.buckets || [];
+        setState({
+          queryKey,
+          buckets: buckets.slice(shown),
+          exhausted: buckets.length < bucketsSize,
+          loading: false,
+        });
+      })
+      .catch(() => setState({ ...current, loading: false }));
+  };
+
+  return (
+    <>
+      {current.buckets.length > 0 && (
+        <List>
+          {current.buckets.map((bucket) => {
+            const keyField = String(bucket.key_as_string || bucket.key);
+            return (
+              <ContribBucketAggregationValuesElement
+                key={keyField}
+                bucket={bucket}
+                isSelected={selectedFilters.some(
+                  ([aggName, value]) =>
+                    aggName === agg.aggName && String(value) === keyField
+                )}
+                onFilterClicked={() => updateQueryFilters([agg.aggName, keyField])}
+              />
+            );
+          })}
+        </List>
+      )}
+      {!current.exhausted && (
+        <Button
+          basic
+          size="mini"
+          loading={current.loading}
+          disabled={current.loading}
+          onClick={showMore}
+        >
+          {i18next.t("Show more")}
+        </Button>
+      )}
+    </>
+  );
+};
+
+ContribFacetMoreBucketsCmp.propTypes = {
+  agg: PropTypes.object.isRequired,
+  currentQueryState: PropTypes.object.isRequired,
+  currentResultsState: PropTypes.object.isRequired,
+  selectedFilters: PropTypes.array.isRequired,
+  updateQueryFilters: PropTypes.func.isRequired,
+};
+
+const ContribFacetMoreBuckets = withState(ContribFacetMoreBucketsCmp);
+
+/**
+ * Nested facet of an aggregation fetched on demand.
+ *
+ * The search response only contains the parent buckets. When a parent bucket
+ * is expanded, the aggregation is requested again, with the same query and
+ * filters, scoped to the parent value through the query parameter declared
+ * in `agg.childAgg.lazy`. Its nested buckets are then merged in the results.
+ *
+ * Each parent is requested at most once per query, with its own search API,
+ * so that expanding a parent does not cancel the request of another one. A
+ * failed request is sent again when the parent is expanded again.
+ */
+const ContribLazyChildAggCmp = ({ agg, currentQueryState, children }) => {
+  const { searchApi: searchApiConfig } = useContext(SearchConfigurationContext);
+  const store = useStore();
+  const { aggName, childAgg } = agg;
+  const queryKey = serializeQueryState(currentQueryState);
+  // parent keys whose nested buckets were fetched, for the current query
+  const [loaded, setLoaded] = useState({ queryKey, keys: new Set() });
+  const loadedKeys = loaded.queryKey === queryKey ? loaded.keys : new Set();
+  // parent keys requested (in flight or fetched), for the current query
+  const requested = useRef({ queryKey, keys: new Set() });
+  if (requested.current.queryKey !== queryKey) {
+    requested.current = { queryKey, keys: new Set() };
+  }
+
+  const loadChildren = useCallback(
+    (parentKey) => {
+      const requestedKeys = requested.current.keys;
+      if (requestedKeys.has(String(parentKey))) {
+        return;
+      }
+      requestedKeys.add(String(parentKey));
+      const param = childAgg.lazy.param || `${aggName}_parent`;
+      new InvenioSearchApi(searchApiConfig)
+        .search(
+          withHiddenParam(facetsQuery(currentQueryState), [param, parentKey])
+        )
+        .then(({ aggregations }) => {
+          const parent = (aggregations?.[aggName]?.buckets || []).find(
+            (bucket) => String(bucket.key) === String(parentKey)
+          );
+          if (currentQueryKey(store) !== queryKey) {
+            return;
+          }
+          setLoaded((previous) => ({
+            queryKey,
+            keys: new Set([
+              ...(previous.queryKey === queryKey ? previous.keys : []),
+              String(parentKey),
+            ]),
+          }));
+          if (!parent) {
+            return;
+          }
+          updateAggregations(store, (current) => ({
+            ...current,
+            [aggName]: {
+              ...current[aggName],
+              buckets: current[aggName].buckets.map((bucket) =>
+                String(bucket.key) === String(parentKey)
+                  ? { ...bucket, [childAgg.aggName]: parent[childAgg.aggName] }
+                  : bucket
+              ),
+            },
+          }));
+        })
+        .catch(() => requestedKeys.delete(String(parentKey)));
+    },
+    [searchApiConfig, store, queryKey, aggName, childAgg]
+  );
+
+  const value = useMemo(
+    () => ({
+      loadChildren,
+      isLoaded: (parentKey) => loadedKeys.has(String(parentKey)),
+    }),
+    [loadChildren, loadedKeys]
+  );
+  return (
+    <LazyChildAggContext.Provider value={value}>
+      {children}
+    </LazyChildAggContext.Provider>
+  );
+};
+
+ContribLazyChildAggCmp.propTypes = {
+  agg: PropTypes.object.isRequired,
+  currentQueryState: PropTypes.object.isRequired,
+  children: PropTypes.node,
+};
+
+ContribLazyChildAggCmp.defaultProps = {
+  children: null,
+};
+
+const ContribLazyChildAgg = withState(ContribLazyChildAggCmp);
+
 export const ContribBucketAggregationElement = ({
   agg,
   title,
@@ -275,7 +529,18 @@ export const ContribBucketAggregationElement = ({
             </Button>
           )}
         </Card.Header>
-        {containerCmp}
+        {agg.childAgg?.lazy ? (
+          <ContribLazyChildAgg agg={agg}>{containerCmp}</ContribLazyChildAgg>
+        ) : (
+          containerCmp
+        )}
+        {agg.paging && (
+          <ContribFacetMoreBuckets
+            agg={agg}
+            selectedFilters={containerCmp?.props.selectedFilters || []}
+            updateQueryFilters={updateQueryFilters}
+          />
+        )}
       </Card.Content>
     </Card>
   );
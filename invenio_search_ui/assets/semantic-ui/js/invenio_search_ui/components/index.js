@@ -9,6 +9,7 @@ export { Results } from "./Results";
 export { SearchBar } from "./SearchBar";
 export { SearchApp } from "./SearchApp";
 export { SearchConfigurationContext } from "./context";
+export { lazyComponent } from "./lazy";
 export { InvenioSearchPagination } from "./InvenioSearchPagination";
 export {
   MultipleOptionsSearchBar,
@@ -18,6 +19,10 @@ export { SearchAppFacets } from "./SearchAppFacets";
 export { SearchAppResultsPane } from "./SearchAppResultsPane";
 export { DropdownSort, DropdownFilter } from "./SearchDropdowns";
 export { SearchFilters } from "./SearchFilters";
+export {
+  VirtualizedResultsGrid,
+  VirtualizedResultsList,
+} from "./VirtualizedResults";
 export {
   ContribSearchAppFacets,
   ContribBucketAggregationElement,
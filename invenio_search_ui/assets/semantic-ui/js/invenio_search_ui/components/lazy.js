@@ -0,0 +1,27 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+import React from "react";
+
+/**
+ * Create a component loaded on demand, in its own chunk.
+ * @function
+ * @param {function} load - dynamic import of the module of the component.
+ * @param {string} name - name of the exported component.
+ * @param {object} fallback - element rendered while the chunk is loading.
+ * @returns {object} React component.
+ */
+export const lazyComponent = (load, name, fallback = null) => {
+  const LazyComponent = React.lazy(() =>
+    load().then((module) => ({ default: module[name] }))
+  );
+  const Component = (props) => (
+    <React.Suspense fallback={fallback}>
+      <LazyComponent {...props} />
+    </React.Suspense>
+  );
+  Component.displayName = `Lazy(${name})`;
+  return Component;
+};
@@ -0,0 +1,35 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+import { serializeQueryState } from "../api/queryState";
+
+// react-searchkit action storing the results of a search
+const RESULTS_FETCH_SUCCESS = "RESULTS_FETCH_SUCCESS";
+
+/**
+ * Key of the current query of a react-searchkit store.
+ * @function
+ * @param {object} store - react-searchkit redux store.
+ * @returns {string} serialized query state.
+ */
+export const currentQueryKey = (store) =>
+  serializeQueryState(store.getState().query);
+
+/**
+ * Replace the aggregations of the current results of a react-searchkit store.
+ *
+ * react-searchkit has no public API to update the current results, hence the
+ * results are stored again with its (internal) success action.
+ * @function
+ * @param {object} store - react-searchkit redux store.
+ * @param {function} update - returns the new aggregations from the current ones.
+ */
+export const updateAggregations = (store, update) => {
+  const { data } = store.getState().results;
+  store.dispatch({
+    type: RESULTS_FETCH_SUCCESS,
+    payload: { ...data, aggregations: update(data.aggregations || {}) },
+  });
+};
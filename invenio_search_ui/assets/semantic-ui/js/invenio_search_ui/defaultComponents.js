@@ -3,7 +3,17 @@
  * SPDX-License-Identifier: MIT
  */
 
-import { ResultsGridItem, ResultsListItem } from "./components";
+import { lazyComponent } from "./components/lazy";
+import { ResultsListItem } from "./components/ResultsListItem";
+
+// The grid view is disabled by default, so its item is only loaded when used.
+const ResultsGridItem = lazyComponent(
+  () =>
+    import(
+      /* webpackChunkName: "invenio_search_ui_grid" */ "./components/ResultsGridItem"
+    ),
+  "ResultsGridItem"
+);
 
 export default {
   "ResultsList.item": ResultsListItem,
@@ -3,7 +3,28 @@
  * SPDX-License-Identifier: MIT
  */
 
+import { translationsLoaded } from "@translations/invenio_search_ui/i18next";
 import defaultComponents from "./defaultComponents";
 import { createSearchAppInit } from "./util";
+import {
+  createSearchApi,
+  AggregationsReusingSearchApi,
+  CachingSearchApi,
+  CancellableSearchApi,
+  PagePrefetchingSearchApi,
+  PrefetchedSearchApi,
+  ProgressiveSearchApi,
+} from "./api";
 
-export { defaultComponents, createSearchAppInit };
+export {
+  defaultComponents,
+  createSearchAppInit,
+  createSearchApi,
+  AggregationsReusingSearchApi,
+  CachingSearchApi,
+  CancellableSearchApi,
+  PagePrefetchingSearchApi,
+  PrefetchedSearchApi,
+  ProgressiveSearchApi,
+  translationsLoaded,
+};
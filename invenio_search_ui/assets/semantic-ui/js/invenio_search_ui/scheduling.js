@@ -0,0 +1,19 @@
+/*
+ * SPDX-FileCopyrightText: 2026 CERN.
+ * SPDX-License-Identifier: MIT
+ */
+
+/**
+ * Run a callback when the browser is idle.
+ * @function
+ * @param {function} callback - called once.
+ * @returns {function} function cancelling the callback.
+ */
+export const whenIdle = (callback) => {
+  if ("requestIdleCallback" in window) {
+    const handle = window.requestIdleCallback(callback, { timeout: 2000 });
+    return () => window.cancelIdleCallback(handle);
+  }
+  const handle = window.setTimeout(callback, 200);
+  return () => window.clearTimeout(handle);
+};
@@ -4,10 +4,91 @@
  */
 
 import { loadComponents } from "@js/invenio_theme/templates";
+import { translationsLoaded } from "@translations/invenio_search_ui/i18next";
+import axios from "axios";
 import _camelCase from "lodash/camelCase";
 import React from "react";
 import ReactDOM from "react-dom";
-import { SearchApp } from "./components";
+// imported directly, so that the components not used by the default search
+// app (e.g. the contrib facets) are not pulled in the entry chunk
+import { SearchApp } from "./components/SearchApp";
+import { whenIdle } from "./scheduling";
+
+/**
+ * Run a callback once an element approaches the viewport.
+ * @function
+ * @param {object} element - observed DOM element.
+ * @param {function} callback - called once.
+ * @returns {function} function cancelling the observation.
+ */
+const whenNearViewport = (element, callback) => {
+  if (!("IntersectionObserver" in window)) {
+    callback();
+    return () => {};
+  }
+  const observer = new IntersectionObserver(
+    (entries) => {
+      if (entries.some((entry) => entry.isIntersecting)) {
+        observer.disconnect();
+        callback();
+      }
+    },
+    // start loading a bit before the element is visible
+    { rootMargin: "200px 0px" }
+  );
+  observer.observe(element);
+  return () => observer.disconnect();
+};
+
+/**
+ * Memoize a function returning a promise, by its (single) argument.
+ * A rejected promise is not kept, so that the call can be retried.
+ * @function
+ * @param {function} fn - function to memoize.
+ * @returns {function} memoized function.
+ */
+const memoizePromise = (fn) => {
+  const cache = new Map();
+  return (key) => {
+    if (!cache.has(key)) {
+      cache.set(
+        key,
+        fn(key).catch((error) => {
+          cache.delete(key);
+          throw error;
+        })
+      );
+    }
+    return cache.get(key);
+  };
+};
+
+/**
+ * Schedule the initialization of a search application.
+ * @function
+ * @param {object} element - root element of the application.
+ * @param {function} init - initializes the application.
+ * @param {string} lazyInit - see `createSearchAppInit`.
+ */
+const scheduleInit = (element, init, lazyInit) => {
+  if (!lazyInit) {
+    init();
+    return;
+  }
+  let done = false;
+  const cancels = [];
+  const once = () => {
+    if (!done) {
+      done = true;
+      cancels.forEach((cancel) => cancel());
+      init();
+    }
+  };
+  cancels.push(whenNearViewport(element, once));
+  if (lazyInit === "idle" && !done) {
+    cancels.push(whenIdle(once));
+  }
+};
 
 /**
  * Initialize React search application.
@@ -18,6 +99,23 @@ import { SearchApp } from "./components";
  * @param {object} multi - enable multiple search application support.
  *    If true, the application is namespaced using `config.appId`. That allows
  *    users to override each application's components using `appId` as a prefix.
+ *
+ * Instead of the inline configuration, the root element can reference it with a
+ * `data-invenio-search-config-url` attribute (i.e. `autoInitDataAttr` suffixed
+ * with `-url`), in which case it is fetched (and cached by the browser).
+ *
+ * If the root element also has a `data-invenio-search-prefetch` attribute, the
+ * response of the initial query it contains is used instead of fetching it.
+ *
+ * The components are resolved once per distinct `appId` (and each configuration
+ * URL is fetched once), then shared by all the roots of the page.
+ * @param {object} ContainerComponent - component wrapping each search application.
+ * @param {string} lazyInit - when to initialize each application:
+ *    - `false`: at once (default),
+ *    - `"viewport"`: when its root element approaches the viewport,
+ *    - `"idle"`: when its root element approaches the viewport, or when the
+ *      browser is idle, whichever comes first.
+ *    Applications already in the viewport are initialized at once.
  * @returns {object} frontend compatible record object
  */
 export function createSearchAppInit(
@@ -26,32 +124,65 @@ export function createSearchAppInit(
   autoInitDataAttr = "invenio-search-config",
   multi = false,
   ContainerComponent = React.Fragment,
+  lazyInit = false,
 ) {
 
-  const initSearchApp = (rootElement) => {
-    const { appId, ...config } = JSON.parse(
-      rootElement.dataset[_camelCase(autoInitDataAttr)]
+  const configUrlDataAttr = `${autoInitDataAttr}-url`;
+
+  const fetchConfig = memoizePromise((configUrl) =>
+    axios.get(configUrl).then((response) => response.data)
+  );
+  const loadAppComponents = memoizePromise((appId) =>
+    loadComponents(appId, defaultComponents)
+  );
+
+  const loadConfig = (rootElement) => {
+    const configUrl = rootElement.dataset[_camelCase(configUrlDataAttr)];
+    if (configUrl) {
+      return fetchConfig(configUrl);
+    }
+    return Promise.resolve(
+      JSON.parse(rootElement.dataset[_camelCase(autoInitDataAttr)])
     );
-    loadComponents(appId, defaultComponents).then((res) => {
-      ReactDOM.render(
-        <ContainerComponent>
-          <SearchApp
-            config={config}
-            // Use appName to namespace application components when overriding
-            {...(multi && { appName: appId })}
-          />
-        </ContainerComponent>,
-        rootElement
+  };
+
+  const initSearchApp = (rootElement) => {
+    const prefetched = rootElement.dataset.invenioSearchPrefetch
+      ? JSON.parse(rootElement.dataset.invenioSearchPrefetch)
+      : null;
+    // the page disables the response cache, e.g. for authenticated users
+    const noResponseCache =
+      rootElement.dataset.invenioSearchResponseCache === "false";
+    loadConfig(rootElement).then(({ appId, ...appConfig }) => {
+      const config = noResponseCache
+        ? { ...appConfig, responseCache: null }
+        : appConfig;
+      // wait for the translations, so that the app is not first rendered in
+      // English
+      return Promise.all([loadAppComponents(appId), translationsLoaded]).then(
+        () => {
+          ReactDOM.render(
+            <ContainerComponent>
+              <SearchApp
+                config={config}
+                prefetched={prefetched}
+                // Use appName to namespace application components when overriding
+                {...(multi && { appName: appId })}
+              />
+            </ContainerComponent>,
+            rootElement
+          );
+        }
       );
     });
   };
 
   if (autoInit) {
     const searchAppElements = document.querySelectorAll(
-      `[data-${autoInitDataAttr}]`
+      `[data-${autoInitDataAttr}], [data-${configUrlDataAttr}]`
     );
     for (const appRootElement of searchAppElements) {
-      initSearchApp(appRootElement);
+      scheduleInit(appRootElement, () => initSearchApp(appRootElement), lazyInit);
     }
   } else {
     return initSearchApp;
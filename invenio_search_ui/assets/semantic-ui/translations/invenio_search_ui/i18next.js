@@ -6,14 +6,16 @@
 import i18n from "i18next";
 
 import LanguageDetector from "i18next-browser-languagedetector";
-import { translations } from "./messages";
+import { loaders, translations } from "./messages";
 import { initReactI18next } from "react-i18next";
 
 const options = {
   fallbackLng: "en", // fallback keys
   returnEmptyString: false,
   debug: process.env.NODE_ENV === "development",
+  // only the fallback language is bundled, see `loadTranslations`
   resources: translations,
+  partialBundledLanguages: true,
   keySeparator: false,
   nsSeparator: false,
   // specify language detection order
@@ -30,7 +32,44 @@ const options = {
   },
 };
 
+/**
+ * Load the catalog of the detected language, if it is not bundled.
+ *
+ * The catalogs are named after the gettext locales (e.g. `zh_CN`), while the
+ * detected languages are BCP 47 tags (e.g. `zh-CN`): the most specific one
+ * available is loaded. Resolves once the catalog is added, or right away if
+ * there is nothing to load (English falls back to the keys).
+ */
+const loadTranslations = (instance) => {
+  const language = instance.languages
+    .map((code) => code.replace("-", "_"))
+    .find((code) => code in translations || code in loaders);
+  if (!language || language in translations) {
+    return Promise.resolve(instance);
+  }
+  return loaders[language]()
+    .then((catalog) => {
+      instance.addResourceBundle(
+        instance.language,
+        "translation",
+        catalog.default || catalog
+      );
+      // re-render the components translated with the fallback language
+      return instance.changeLanguage(instance.language);
+    })
+    .catch((error) => {
+      console.error(`Failed to load the ${language} translations`, error);
+    })
+    .then(() => instance);
+};
+
 const i18next = i18n.createInstance();
-i18next.use(LanguageDetector).use(initReactI18next).init(options);
+// resolves once the page language can be rendered: components translated
+// with `i18next.t` at render time should be mounted afterwards
+const translationsLoaded = i18next
+  .use(LanguageDetector)
+  .use(initReactI18next)
+  .init(options)
+  .then(() => loadTranslations(i18next));
 
-export { i18next };
+export { i18next, translationsLoaded };
@@ -7,17 +7,18 @@
 /*
 This will import translations from an auto-generated file in order to not have to manually adapt the provided languages.
 The auto generated file will be created when running npm run compile_catalog
-File structure of the generated file in '_generatedTranslations.js' will look like:
-import TRANSLATE_de from "./de/translations.json";
+Only the fallback language is bundled, the other languages are loaded on demand,
+each one in its own chunk. File structure of the generated file in '_generatedTranslations.js' will look like:
 import TRANSLATE_en from "./en/translations.json";
-import TRANSLATE_es from "./es/translations.json";
 export const translations = {
-  de: { translation: TRANSLATE_de },
   en: { translation: TRANSLATE_en },
-  es: { translation: TRANSLATE_es },
+};
+export const loaders = {
+  de: () => import("./de/translations.json"),
+  es: () => import("./es/translations.json"),
 };
 */
 
-import { translations } from "./_generatedTranslations";
+import { loaders, translations } from "./_generatedTranslations";
 
-export { translations };
+export { loaders, translations };
@@ -12,6 +12,7 @@ const PACKAGE_MESSAGES_PATH = "./messages";
 const PO_FILENAME = "messages.po";
 const JSON_FILENAME = "translations.json";
 const GENERATED_FILE = "_generatedTranslations.js";
+const FALLBACK_LANGUAGE = "en";
 
 // it accepts the same options as the cli.
 // https://github.com/i18next/i18next-gettext-converter#options
@@ -47,20 +48,28 @@ async function compileAndCreateFileForLanguage(parentPath, lang) {
 function writeGeneratedTranslationsFile(languages) {
   const generatedPath = path.join(PACKAGE_MESSAGES_PATH, GENERATED_FILE);
   let content = "// AUTO-GENERATED FILE - DO NOT EDIT MANUALLY\n";
-  content += "// This file exports all available translations for i18next\n\n";
+  content += "// This file exports all available translations for i18next\n";
+  content += `// Only the fallback language (${FALLBACK_LANGUAGE}) is bundled, the others are\n`;
+  content += "// loaded on demand, each one in its own chunk.\n\n";
 
-  // Generate imports
-  languages.forEach((lang) => {
-    const varName = lang.toUpperCase().replace(/-/g, "_");
-    content += `import TRANSLATE_${varName} from "./${lang}/${JSON_FILENAME}";\n`;
-  });
+  // Generate the import of the fallback language
+  const fallbackVarName = FALLBACK_LANGUAGE.toUpperCase().replace(/-/g, "_");
+  content += `import TRANSLATE_${fallbackVarName} from "./${FALLBACK_LANGUAGE}/${JSON_FILENAME}";\n`;
 
   // Generate exports
   content += "\nexport const translations = {\n";
-  languages.forEach((lang) => {
-    const varName = lang.toUpperCase().replace(/-/g, "_");
-    content += `  ${lang}: { translation: TRANSLATE_${varName} },\n`;
-  });
+  content += `  ${FALLBACK_LANGUAGE}: { translation: TRANSLATE_${fallbackVarName} },\n`;
+  content += "};\n";
+
+  content += "\nexport const loaders = {\n";
+  languages
+    .filter((lang) => lang !== FALLBACK_LANGUAGE)
+    .forEach((lang) => {
+      content += `  ${lang}: () =>\n`;
+      content += `    import(\n`;
+      content += `      /* webpackChunkName: "invenio_search_ui_i18n_${lang}" */ "./${lang}/${JSON_FILENAME}"\n`;
+      content += `    ),\n`;
+    });
   content += "};\n";
 
   writeFileSync(generatedPath, content);
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Command line interface of Invenio-Search-UI."""
+
+import os
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from .compression import available_encodings, compress_file, search_ui_static_files
+
+
+@click.group("search-ui")
+def search_ui():
+    """Search UI commands."""
+
+
+@search_ui.command("build-configs")
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False),
+    help="Output directory (defaults to SEARCH_UI_PREBUILT_CONFIGS_DIR in the "
+    "static folder).",
+)
+@click.option(
+    "--locale",
+    "locales",
+    multiple=True,
+    help="Locale to build (defaults to all the configured languages).",
+)
+@with_appcontext
+def build_configs(output_dir, locales):
+    """Prebuild the search app configurations as static files."""
+    if output_dir is None:
+        output_dir = os.path.join(
+            current_app.static_folder,
+            current_app.config["SEARCH_UI_PREBUILT_CONFIGS_DIR"],
+        )
+    search_apps = current_app.extensions["invenio-search-ui"].search_apps
+    manifest = search_apps.build(output_dir, locales=locales or None)
+    for name, files in sorted(manifest["apps"].items()):
+        for locale, filename in sorted(files.items()):
+            click.echo("{0} [{1}]: {2}".format(name, locale, filename))
+    click.secho(
+        "Search app configurations written to {0}".format(output_dir), fg="green"
+    )
+
+
+@search_ui.command("compress-assets")
+@with_appcontext
+def compress_assets():
+    """Write the precompressed variants of the search UI static files."""
+    encodings = [encoding for encoding, _ in available_encodings()]
+    if "br" not in encodings:
+        click.secho("brotli is not installed, skipping the .br variants.", fg="yellow")
+
+    app = current_app._get_current_object()
+    for path in search_ui_static_files(app):
+        written = compress_file(path)
+        click.echo(
+            "{0}: {1}".format(
+                os.path.relpath(path, app.static_folder),
+                ", ".join(os.path.basename(variant) for variant in written) or "-",
+            )
+        )
+    click.secho(
+        "Search UI static files compressed ({0})".format(", ".join(encodings)),
+        fg="green",
+    )
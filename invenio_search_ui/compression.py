@@ -0,0 +1,261 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Precompressed static files of the search UI.
+
+The static outputs of the search UI (webpack bundles, AngularJS templates and
+prebuilt search app configurations) can be compressed at deploy time with:
+
+.. code-block:: console
+
+    $ invenio search-ui compress-assets
+
+which writes ``.br`` (if `brotli <https://pypi.org/project/Brotli/>`_ is
+installed) and ``.gz`` siblings next to each file. With
+``SEARCH_UI_PRECOMPRESSED_ASSETS`` enabled, requests to the static files are
+then answered with the best precompressed variant accepted by the client.
+"""
+
+import gzip
+import json
+import mimetypes
+import os
+
+from flask import current_app, request, send_from_directory
+from werkzeug.security import safe_join
+
+from .webpack import search_ui
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+ENCODINGS = (
+    # (content coding, file suffix), by order of preference
+    ("br", ".br"),
+    ("gzip", ".gz"),
+)
+"""Content codings of the precompressed variants."""
+
+WEBPACK_SUFFIXES = (".js", ".css")
+"""Suffixes of the webpack outputs which are compressed."""
+
+
+def _compress(data, encoding):
+    """Compress data with a content coding."""
+    if encoding == "br":
+        return brotli.compress(data, mode=brotli.MODE_TEXT)
+    # without timestamp, so that builds are reproducible
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def available_encodings():
+    """Content codings which can be generated in this environment."""
+    return [
+        (encoding, suffix)
+        for encoding, suffix in ENCODINGS
+        if encoding != "br" or brotli is not None
+    ]
+
+
+def compress_file(path):
+    """Write the precompressed variants of a file.
+
+    Variants which are not smaller than the file itself are not written (and
+    any previous one is removed), as they would only waste bandwidth.
+
+    :param path: Path of the file.
+    :returns: The paths of the written variants.
+    """
+    with open(path, "rb") as fp:
+        data = fp.read()
+
+    written = []
+    for encoding, suffix in available_encodings():
+        compressed = _compress(data, encoding)
+        if len(compressed) >= len(data):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+            continue
+        with open(path + suffix, "wb") as fp:
+            fp.write(compressed)
+        written.append(path + suffix)
+    return written
+
+
+def search_ui_entries():
+    """Names of the webpack entries of the search UI, in all its themes."""
+    return {entry for bundle in search_ui.themes.values() for entry in bundle.entry}
+
+
+def search_ui_webpack_files(app):
+    """Find the webpack outputs of the search UI in the webpack manifest.
+
+    The files of the search UI entries are listed in the manifest written by
+    ``webpack-bundle-tracker`` (``WEBPACKEXT_MANIFEST_PATH``), including the
+    chunks split from them (e.g. the vendor chunks). The manifest does not
+    tell which entry loads the lazy chunks (e.g. the translation catalogs),
+    so all the assets which are not part of any entry are included as well.
+
+    :param app: The Flask application.
+    :returns: The absolute paths of the files, which might not exist.
+    """
+    manifest_path = app.config.get("WEBPACKEXT_MANIFEST_PATH", "dist/manifest.json")
+    if not manifest_path or not app.static_folder:
+        return set()
+    try:
+        with open(os.path.join(app.static_folder, manifest_path)) as fp:
+            manifest = json.load(fp)
+    except (OSError, ValueError):
+        return set()
+
+    chunks = manifest.get("chunks") or {}
+    names = {name for entry in search_ui_entries() for name in chunks.get(entry, ())}
+    entry_names = {name for files in chunks.values() for name in files}
+    names.update(
+        name for name in manifest.get("assets") or {} if name not in entry_names
+    )
+
+    dist_dir = app.config.get(
+        "WEBPACKEXT_PROJECT_DISTDIR", os.path.join(app.static_folder, "dist")
+    )
+    return {
+        os.path.join(dist_dir, name)
+        for name in names
+        if isinstance(name, str) and name.endswith(WEBPACK_SUFFIXES)
+    }
+
+
+def search_ui_static_files(app):
+    """Find the static outputs of the search UI.
+
+    These are the AngularJS templates of ``SEARCH_UI_JSTEMPLATE_*``, the
+    webpack outputs of the search UI (see :func:`search_ui_webpack_files`) and
+    the prebuilt search app configurations.
+
+    :param app: The Flask application.
+    :returns: The sorted absolute paths of the existing files.
+    """
+    paths = search_ui_webpack_files(app)
+    for key, value in app.config.items():
+        if key.startswith("SEARCH_UI_JSTEMPLATE_") and isinstance(value, str):
+            paths.add(os.path.join(app.static_folder, value))
+
+    configs_dir = os.path.join(
+        app.static_folder, app.config["SEARCH_UI_PREBUILT_CONFIGS_DIR"]
+    )
+    for root, _, filenames in os.walk(configs_dir):
+        for filename in filenames:
+            if filename.endswith(".json"):
+                paths.add(os.path.join(root, filename))
+
+    suffixes = tuple(suffix for _, suffix in ENCODINGS)
+    return sorted(
+        path for path in paths if os.path.isfile(path) and not path.endswith(suffixes)
+    )
+
+
+class SearchUIStaticFiles:
+    """Static files of the search UI which can be served precompressed.
+
+    The files are found with :func:`search_ui_static_files` on first use, and
+    found again whenever the webpack manifest changes (e.g. after a new build).
+    """
+
+    def __init__(self, app):
+        """Initialize the static files.
+
+        :param app: The Flask application.
+        """
+        self.app = app
+        self._files = None
+        self._manifest_mtime = None
+
+    def _get_manifest_mtime(self):
+        """Modification time of the webpack manifest, if it exists."""
+        manifest_path = self.app.config.get(
+            "WEBPACKEXT_MANIFEST_PATH", "dist/manifest.json"
+        )
+        try:
+            return os.path.getmtime(os.path.join(self.app.static_folder, manifest_path))
+        except (OSError, TypeError):
+            return None
+
+    @property
+    def files(self):
+        """Paths of the files, relative to the static folder."""
+        manifest_mtime = self._get_manifest_mtime()
+        if self._files is None or manifest_mtime != self._manifest_mtime:
+            self._files = {
+                os.path.relpath(path, self.app.static_folder).replace(os.sep, "/")
+                for path in search_ui_static_files(self.app)
+            }
+            self._manifest_mtime = manifest_mtime
+        return self._files
+
+    def __contains__(self, filename):
+        """Check if a static file belongs to the search UI."""
+        return filename in self.files
+
+
+def precompressed_variants(path):
+    """Get the up-to-date precompressed variants of a file.
+
+    Variants older than the file itself are ignored, so that a file updated
+    without compressing it again is never served outdated.
+
+    :param path: Path of the file.
+    :returns: The ``(content coding, file suffix)`` of each variant.
+    """
+    mtime = os.path.getmtime(path)
+    return [
+        (encoding, suffix)
+        for encoding, suffix in ENCODINGS
+        if os.path.isfile(path + suffix) and os.path.getmtime(path + suffix) >= mtime
+    ]
+
+
+def send_precompressed():
+    """Serve the precompressed variant of a static file.
+
+    Registered to run before every request, it answers requests to the
+    ``static`` endpoint of the search UI files (see
+    :class:`SearchUIStaticFiles`) with precompressed variants when
+    ``SEARCH_UI_PRECOMPRESSED_ASSETS`` is enabled. The variant is negotiated
+    with the ``Accept-Encoding`` header of the request, and the response is
+    sent with the ``Content-Encoding`` of the variant and the mimetype of the
+    original file. Other requests are left to their view.
+    """
+    if (
+        request.endpoint != "static"
+        or not current_app.config["SEARCH_UI_PRECOMPRESSED_ASSETS"]
+        or not current_app.static_folder
+    ):
+        return None
+
+    filename = request.view_args["filename"]
+    if filename not in current_app.extensions["invenio-search-ui"].static_files:
+        return None
+    path = safe_join(current_app.static_folder, filename)
+    if path is None or not os.path.isfile(path):
+        return None
+    variants = precompressed_variants(path)
+    if not variants:
+        return None
+
+    accept = request.accept_encodings
+    encoding, suffix = max(variants, key=lambda variant: accept.quality(variant[0]))
+    if accept.quality(encoding) > 0:
+        mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        response = send_from_directory(
+            current_app.static_folder,
+            filename + suffix,
+            mimetype=mimetype,
+            max_age=current_app.get_send_file_max_age(filename),
+        )
+        response.content_encoding = encoding
+    else:
+        response = send_from_directory(current_app.static_folder, filename)
+    response.vary.add("Accept-Encoding")
+    return response
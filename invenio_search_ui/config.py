@@ -11,6 +11,71 @@ SEARCH_UI_SEARCH_VIEW = search
 SEARCH_UI_SEARCH_TEMPLATE = "invenio_search_ui/search.html"
 """Configure the search page template."""
 
+SEARCH_UI_TIMING = False
+"""Time the phases of the search page generation.
+
+The durations of the configuration generation, its JSON serialization, the
+webpack manifest loading and the template rendering are sent with the
+:data:`invenio_search_ui.signals.search_timing` signal. Either a boolean or a
+callable receiving the request, e.g. to sample requests:
+
+.. code-block:: python
+
+    SEARCH_UI_TIMING = lambda request: random.random() < 0.01
+"""
+
+SEARCH_UI_SERVER_TIMING = False
+"""Expose the timed phases in a ``Server-Timing`` response header.
+
+Either a boolean or a callable receiving the request, e.g. to limit the
+header to trusted clients. Implies :data:`SEARCH_UI_TIMING`.
+"""
+
+SEARCH_UI_CONDITIONAL_REQUESTS = False
+"""Answer conditional requests to the search page with ``304 Not Modified``.
+
+The search page (rendered by :data:`SEARCH_UI_SEARCH_VIEW`) is validated with
+an ETag computed from :data:`SEARCH_UI_SEARCH_TEMPLATE` and the templates it
+uses, the compiled :data:`SEARCH_UI_SEARCH_APPS`, the search UI and records
+REST configuration, the locale and the webpack manifest. Only
+enable it if the page does not depend on other request data: it is always
+rendered in full when the session is not empty, the user is authenticated or
+results are prefetched (see :data:`SEARCH_UI_PREFETCH_BACKEND`).
+
+A custom :data:`SEARCH_UI_SEARCH_VIEW` is only validated if it provides its
+own validator (see :func:`invenio_search_ui.views.conditional_search_view`).
+"""
+
+SEARCH_UI_RESPONSE_CACHE = None
+"""Allow the client-side response cache of the search apps in the current page.
+
+The cache is enabled per search app with its ``response_cache`` option, and
+only used in the pages for which this is true: either a boolean or a callable
+receiving the request. By default (``None``), it is only used for anonymous
+users, as the search responses of authenticated users can contain records
+private to them (e.g. drafts).
+
+The configurations generated with
+:func:`invenio_search_ui.searchconfig.search_app_config` account for it. Pages
+rendering a registered search app (see :data:`SEARCH_UI_SEARCH_APPS`) must
+disable it on the root element of the app:
+
+.. code-block:: html+jinja
+
+    <div data-invenio-search-config='{{ search_apps.json("search") }}'
+      {%- if not search_app_response_cache() %}
+        data-invenio-search-response-cache="false"
+      {%- endif %}></div>
+"""
+
+SEARCH_UI_CONFIG_CACHE_SIZE = 128
+"""Maximum number of generated search app configs kept in memory.
+
+The configs produced by :func:`invenio_search_ui.searchconfig.search_app_config`
+are cached per process, keyed by a fingerprint of their inputs and of the
+current locale. Set to ``0`` to disable the cache.
+"""
+
 # The configuration below is for the AngularJS search app configuration
 
 SEARCH_UI_SEARCH_API = "/api/records/"
@@ -60,3 +125,86 @@ SEARCH_UI_SEARCH_CONFIG_GEN = {
     "invenio_records_rest": SearchAppInvenioRestConfigHelper,
 }
 """Override the Invenio-Search-JS config generator."""
+
+SEARCH_UI_SEARCH_APPS = {}
+"""Named search apps, validated and compiled once at application startup.
+
+Each search app declares its ``generator`` (a key of
+:data:`SEARCH_UI_SEARCH_CONFIG_GEN`, an import string or a generator class),
+the ``options`` passed to it and optional ``overrides``:
+
+.. code-block:: python
+
+    SEARCH_UI_SEARCH_APPS = {
+        "search": {
+            "generator": "invenio_records_rest",
+            "options": {"endpoint_id": "recid", "app_id": "search"},
+        },
+    }
+
+Templates read the compiled configuration by name, e.g.
+``{{ search_apps.json("search") }}``.
+"""
+
+SEARCH_UI_CONFIG_URL = False
+"""Load the configuration of the registered search apps from a URL.
+
+If enabled, the search page references ``/search/config/<app_id>.json``
+instead of inlining the configuration, so that both the page and the
+configuration can be cached by the browser and by proxies.
+"""
+
+SEARCH_UI_CONFIG_MAX_AGE = 31536000
+"""Cache max age (in seconds) of the versioned search app configuration URLs."""
+
+SEARCH_UI_PREBUILT_CONFIGS = False
+"""Reference the prebuilt search app configurations from the search page.
+
+The configurations are built at deploy time in the static folder with:
+
+.. code-block:: console
+
+    $ invenio search-ui build-configs
+
+Search apps without an up-to-date prebuilt configuration fall back to
+``/search/config/<app_id>.json``.
+"""
+
+SEARCH_UI_PREBUILT_CONFIGS_DIR = "search-ui/configs"
+"""Directory, relative to the static folder, of the prebuilt configurations."""
+
+SEARCH_UI_PRECOMPRESSED_ASSETS = False
+"""Serve the precompressed variants of the static files.
+
+The ``.br`` and ``.gz`` variants of the search UI static files are built at
+deploy time (after collecting the static files and building the webpack
+bundles) with:
+
+.. code-block:: console
+
+    $ invenio search-ui compress-assets
+
+Requests to these files (and only these, other static files are left to the
+``static`` view) are then answered with the up-to-date variant matching their
+``Accept-Encoding`` header. Disable it if the static
+files are served by a web server handling the variants itself (e.g. with
+nginx ``gzip_static``).
+"""
+
+SEARCH_UI_PREFETCH_BACKEND = None
+"""Callable (or import string) running the initial query on the server.
+
+When set, the default search view runs the initial query of the ``search``
+app of :data:`SEARCH_UI_SEARCH_APPS` on the server and embeds the response in
+the page, so that the React app is rendered without a second round trip. It
+is called with the search app configuration and the initial query state
+(restored from the URL arguments of the page like the search app does, see
+:func:`invenio_search_ui.views.url_query`), and must return the search REST
+API response body (or ``None`` to skip it):
+
+.. code-block:: python
+
+    def prefetch_backend(config, query):
+        result = service.search(g.identity, params={"q": query["queryString"]})
+        return result.to_dict()
+"""
@@ -5,6 +5,9 @@
 """UI for Invenio-Search."""
 
 from . import config
+from .compression import SearchUIStaticFiles
+from .registry import SearchAppRegistry
+from .searchconfig import SearchAppConfigCache
 
 
 class InvenioSearchUI(object):
@@ -24,6 +27,11 @@ class InvenioSearchUI(object):
         :param app: The Flask application.
         """
         self.init_config(app)
+        self.config_cache = SearchAppConfigCache(
+            app.config["SEARCH_UI_CONFIG_CACHE_SIZE"]
+        )
+        self.search_apps = SearchAppRegistry(app)
+        self.static_files = SearchUIStaticFiles(app)
         app.extensions["invenio-search-ui"] = self
 
     def init_config(self, app):
@@ -41,3 +49,12 @@ class InvenioSearchUI(object):
         for k in dir(config):
             if k.startswith("SEARCH_UI_"):
                 app.config.setdefault(k, getattr(config, k))
+
+
+def finalize_app(app):
+    """Finalize app.
+
+    Compiles the search apps declared in ``SEARCH_UI_SEARCH_APPS``, so that
+    misconfigurations are reported at startup.
+    """
+    app.extensions["invenio-search-ui"].search_apps.compile()
@@ -0,0 +1,230 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Registry of the search apps declared in the configuration."""
+
+import hashlib
+import os
+import threading
+
+from flask import current_app, json
+from invenio_base.utils import obj_or_import_string
+from invenio_i18n import force_locale, get_locale
+
+from .searchconfig import config_fingerprint
+from .timing import timed
+
+
+class CompiledSearchApp:
+    """A validated search app configuration.
+
+    The configuration is generated once, and its JSON dump is computed once
+    per locale (as titles can be lazy translated strings).
+    """
+
+    def __init__(self, name, config):
+        """Initialize the compiled search app.
+
+        :param name: Name of the search app in the registry.
+        :param config: The generated React-SearchKit configuration.
+        """
+        self.name = name
+        self._config = config
+        self._json = {}
+        self._etags = {}
+        self.fingerprint = config_fingerprint(config)
+
+    @property
+    def config(self):
+        """A copy of the generated configuration."""
+        return json.loads(self.json())
+
+    def json(self, locale=None):
+        """The JSON dump of the configuration for the given (or current) locale."""
+        locale = str(locale or get_locale())
+        dump = self._json.get(locale)
+        if dump is None:
+            with timed("json"):
+                dump = self._json[locale] = json.dumps(
+                    self._config, separators=(",", ":")
+                )
+        return dump
+
+    def etag(self, locale=None):
+        """Content hash of the JSON dump for the given (or current) locale."""
+        locale = str(locale or get_locale())
+        etag = self._etags.get(locale)
+        if etag is None:
+            etag = self._etags[locale] = hashlib.sha1(
+                self.json(locale=locale).encode("utf-8")
+            ).hexdigest()
+        return etag
+
+
+class SearchAppRegistry:
+    """Named search apps, compiled from ``SEARCH_UI_SEARCH_APPS``.
+
+    Each search app is declared with the ``generator`` (a key of
+    ``SEARCH_UI_SEARCH_CONFIG_GEN``, an import string or an object providing a
+    ``generate`` class method), the ``options`` passed to the generator and
+    optional ``overrides`` of the generated keys.
+    """
+
+    def __init__(self, app):
+        """Initialize the registry.
+
+        :param app: The Flask application.
+        """
+        self.app = app
+        self._apps = None
+        self._prebuilt = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, name):
+        """Check if a search app is registered."""
+        return name in self.apps
+
+    def __getitem__(self, name):
+        """Get a compiled search app."""
+        return self.apps[name]
+
+    def __iter__(self):
+        """Iterate over the names of the search apps."""
+        return iter(self.apps)
+
+    @property
+    def apps(self):
+        """The compiled search apps, compiled on first access if needed."""
+        if self._apps is None:
+            self.compile()
+        return self._apps
+
+    @property
+    def fingerprint(self):
+        """Fingerprint of all the compiled search apps."""
+        return config_fingerprint(
+            sorted((name, app.fingerprint) for name, app in self.apps.items())
+        )
+
+    def json(self, name, locale=None):
+        """JSON dump of a search app configuration."""
+        return self[name].json(locale=locale)
+
+    def config(self, name):
+        """Copy of a search app configuration."""
+        return self[name].config
+
+    def locales(self):
+        """Locales for which the configurations are prebuilt."""
+        locales = [self.app.config.get("BABEL_DEFAULT_LOCALE", "en")]
+        for locale, dummy_title in self.app.config.get("I18N_LANGUAGES", []):
+            if locale not in locales:
+                locales.append(locale)
+        return locales
+
+    def build(self, output_dir, locales=None):
+        """Write the configurations as content-hashed static files.
+
+        A configuration file is written for each search app and locale, along
+        with a ``manifest.json`` mapping them to their file names. Requires an
+        application context.
+
+        :param output_dir: Directory where the files are written.
+        :param locales: Locales to build (defaults to :meth:`locales`).
+        :returns: The manifest.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        manifest = {"fingerprint": self.fingerprint, "apps": {}}
+        for name, search_app in self.apps.items():
+            files = manifest["apps"][name] = {}
+            for locale in locales or self.locales():
+                with force_locale(locale):
+                    dump = search_app.json(locale=locale)
+                    filename = "{0}.{1}.{2}.json".format(
+                        name, locale, search_app.etag(locale=locale)[:16]
+                    )
+                with open(os.path.join(output_dir, filename), "w") as fp:
+                    fp.write(dump)
+                files[locale] = filename
+        with open(os.path.join(output_dir, "manifest.json"), "w") as fp:
+            json.dump(manifest, fp, indent=2, sort_keys=True)
+        return manifest
+
+    @property
+    def prebuilt(self):
+        """Manifest of the prebuilt configurations.
+
+        It is ``None`` if the manifest is missing or does not match the
+        compiled search apps anymore.
+        """
+        if self._prebuilt is None:
+            path = os.path.join(
+                self.app.static_folder or "",
+                self.app.config["SEARCH_UI_PREBUILT_CONFIGS_DIR"],
+                "manifest.json",
+            )
+            try:
+                with open(path) as fp:
+                    manifest = json.load(fp)
+            except (OSError, ValueError):
+                manifest = {}
+            if manifest.get("fingerprint") != self.fingerprint:
+                if manifest:
+                    self.app.logger.warning(
+                        "Prebuilt search app configurations are outdated."
+                    )
+                manifest = {}
+            self._prebuilt = manifest
+        return self._prebuilt or None
+
+    def prebuilt_file(self, name, locale=None):
+        """Path, relative to the static folder, of a prebuilt configuration."""
+        manifest = self.prebuilt
+        if manifest is None:
+            return None
+        filename = manifest["apps"].get(name, {}).get(str(locale or get_locale()))
+        if filename is None:
+            return None
+        return "/".join(
+            (self.app.config["SEARCH_UI_PREBUILT_CONFIGS_DIR"].strip("/"), filename)
+        )
+
+    def compile(self):
+        """Validate and compile all the declared search apps.
+
+        :raises ValueError: If a search app is misconfigured.
+        """
+        with self._lock:
+            with self.app.app_context():
+                self._apps = {
+                    name: self._compile(name, definition)
+                    for name, definition in self.app.config[
+                        "SEARCH_UI_SEARCH_APPS"
+                    ].items()
+                }
+
+    def _compile(self, name, definition):
+        """Compile a single search app."""
+        generators = current_app.config["SEARCH_UI_SEARCH_CONFIG_GEN"]
+        generator = definition.get("generator")
+        try:
+            generator = obj_or_import_string(generators.get(generator, generator))
+        except ImportError:
+            generator = None
+        if not hasattr(generator, "generate"):
+            raise ValueError(
+                "Search app '{0}' has no valid generator: {1!r}".format(
+                    name, definition.get("generator")
+                )
+            )
+        try:
+            config = generator.generate(
+                definition.get("options", {}), **definition.get("overrides", {})
+            )
+            compiled = CompiledSearchApp(name, config)
+            compiled.json()
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(
+                "Search app '{0}' is misconfigured: {1}".format(name, e)
+            ) from e
+        return compiled
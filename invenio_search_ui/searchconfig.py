@@ -3,9 +3,159 @@
 
 """Search app configuration helper."""
 
-from copy import deepcopy
+import hashlib
+import threading
+from collections import OrderedDict
 
-from flask import current_app
+from flask import current_app, has_request_context, json, request
+from invenio_i18n import get_locale
+
+from .timing import timed
+
+try:
+    from flask_login import current_user
+except ImportError:  # pragma: no cover
+    current_user = None
+
+
+class SearchAppConfigCache:
+    """Bounded, process-level LRU cache for generated search app configs.
+
+    Entries are keyed by a fingerprint of all the inputs of the generation
+    (see :func:`config_fingerprint`), so that a change of any of them results
+    in a new entry, while the least recently used entries are evicted once
+    ``maxsize`` is reached.
+    """
+
+    def __init__(self, maxsize=128):
+        """Initialize the cache.
+
+        :param maxsize: Maximum number of entries, ``0`` disables the cache.
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Number of cached entries."""
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """Check if an entry is cached."""
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """Get an entry and mark it as the most recently used."""
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return default
+            return self._entries[key]
+
+    def set(self, key, value):
+        """Store an entry, evicting the least recently used ones if needed."""
+        if self.maxsize <= 0:
+            return value
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _fingerprint_default(obj):
+    """Serialize values unknown to JSON for fingerprinting."""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(repr(o) for o in obj)
+    if callable(obj) and hasattr(obj, "__qualname__"):
+        # functions and classes, without their (per process) address
+        return "{0}.{1}".format(obj.__module__, obj.__qualname__)
+    return repr(obj)
+
+
+def config_fingerprint(*values):
+    """Compute a stable fingerprint of configuration values.
+
+    :param values: JSON-like values, other objects are represented by their
+        ``repr()``.
+    :returns: A hexadecimal digest.
+    """
+    payload = json.dumps(
+        values, sort_keys=True, separators=(",", ":"), default=_fingerprint_default
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class FrozenDict(dict):
+    """Read-only dictionary, serialized to JSON as a regular dictionary."""
+
+    def _readonly(self, *args, **kwargs):
+        """Reject any modification."""
+        raise TypeError("'FrozenDict' object does not support item assignment")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        """Frozen dictionaries are shared instead of copied."""
+        return self
+
+    def __deepcopy__(self, memo):
+        """Frozen dictionaries are shared instead of copied."""
+        return self
+
+    def __reduce__(self):
+        """Pickle as a frozen dictionary."""
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value):
+    """Recursively convert dictionaries and lists to read-only structures.
+
+    :param value: A JSON-like value.
+    :returns: The value with dictionaries as :class:`FrozenDict` and lists as
+        tuples.
+    """
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+_definitions = SearchAppConfigCache(maxsize=4096)
+"""Values derived once from facet and sort definitions, keyed by identity."""
+
+
+def memoize_definition(kind, definition, factory):
+    """Derive a value from a facet or sort definition once.
+
+    Definitions are typically module level constants, hence they are tracked
+    by identity and must not be modified once used.
+
+    :param kind: Name of the derived value.
+    :param definition: The definition object.
+    :param factory: Callable computing the value from the definition.
+    """
+    key = (kind, id(definition))
+    entry = _definitions.get(key)
+    if entry is None or entry[0] is not definition:
+        entry = _definitions.set(key, (definition, factory(definition)))
+    return entry[1]
+
+
+def definitions_fingerprint(definitions):
+    """Fingerprint of facet or sort definitions, computed once per object."""
+    return memoize_definition("fingerprint", definitions, config_fingerprint)
 
 
 class SearchOptionsSelector:
@@ -49,26 +199,101 @@ class FacetsConfig(SearchOptionsSelector):
     """Facets options for the search configuration."""
 
     def map_option(self, key, option):
-        """Generate an RSK aggregation option."""
+        """Generate an RSK aggregation option.
+
+        The UI definition is frozen once and shared, only the top-level
+        dictionary is created for each aggregation.
+        """
         title = option.get("title", option["facet"]._label)
+        ui = dict(memoize_definition("facet", option, self.freeze_option))
+        ui["aggName"] = key
+        ui["title"] = title
+        return ui
 
-        ui = deepcopy(option["ui"])
-        ui.update(
-            {
-                "aggName": key,
-                "title": title,
-            }
-        )
+    default_paging = dict(size=10, param=None)
 
-        # Nested facets
+    default_lazy_child_agg = dict(param=None)
+
+    @classmethod
+    def freeze_option(cls, option):
+        """Freeze the UI definition of a facet, with the nested facet defaults.
+
+        A facet declared with ``paging`` (``True`` or a dictionary with the
+        number of buckets loaded at a time, ``size``, and the query parameter
+        setting the number of buckets, ``param``, which defaults to
+        ``<aggName>_size``) shows its buckets incrementally.
+
+        A nested facet declared with ``lazy`` (``True`` or a dictionary with
+        the query parameter scoping the nested facet to a parent value,
+        ``param``, which defaults to ``<aggName>_parent``) is only fetched when
+        a parent bucket is expanded.
+
+        :raises ValueError: If the paging options are invalid.
+        """
+        ui = option["ui"]
         if "childAgg" in ui:
-            ui["childAgg"].setdefault("aggName", "inner")
-            ui["childAgg"].setdefault("title", title)
+            child_agg = {
+                "aggName": "inner",
+                "title": option.get("title", option["facet"]._label),
+            }
+            child_agg.update(ui["childAgg"])
+            if child_agg.get("lazy"):
+                lazy = dict(cls.default_lazy_child_agg)
+                if isinstance(child_agg["lazy"], dict):
+                    lazy.update(child_agg["lazy"])
+                child_agg["lazy"] = lazy
+            ui = dict(ui, childAgg=child_agg)
+        if ui.get("paging"):
+            paging = dict(cls.default_paging)
+            if isinstance(ui["paging"], dict):
+                paging.update(ui["paging"])
+            if not isinstance(paging["size"], int) or paging["size"] <= 0:
+                raise ValueError("Facet paging size should be a positive integer")
+            ui = dict(ui, paging=paging)
+        return freeze(ui)
+
+
+class SearchAppOptions:
+    """Search app options, validated once at construction.
+
+    The accepted options and their defaults are declared in
+    ``default_options``, which concrete classes also use as ``__slots__``.
+    Unknown options are rejected.
+    """
 
-        return ui
+    __slots__ = ()
 
+    default_options = {}
 
-class SearchAppConfig:
+    def __init__(self, configuration_options):
+        """Initialize and validate the options.
+
+        :raises ValueError: If an option is unknown or invalid.
+        """
+        unknown = set(configuration_options) - set(self.default_options)
+        if unknown:
+            raise ValueError(
+                "Unknown search app options: {0}".format(", ".join(sorted(unknown)))
+            )
+        options = dict(self.default_options)
+        options.update(configuration_options)
+        for key, value in options.items():
+            setattr(self, key, value)
+        self.validate()
+
+    def validate(self):
+        """Validate the options.
+
+        :raises ValueError: If an option is invalid.
+        """
+        for key in ("list_view", "grid_view"):
+            if not isinstance(getattr(self, key), bool):
+                raise ValueError("Parameter {0} should be a boolean".format(key))
+        if not all(isinstance(o, int) for o in self.pagination_options):
+            raise ValueError("Parameter pagination_options should contain integers")
+
+
+class SearchAppConfig(SearchAppOptions):
     """Configuration generator for React-SearchKit."""
 
     default_options = dict(
@@ -84,7 +309,25 @@ class SearchAppConfig:
         default_max_results=10000,
         facets=None,
         sort=None,
-        initial_filters=[],
+        initial_filters=(),
+        response_cache=None,
+        request_debounce=None,
+        prefetch_pages=None,
+        batch_endpoint=None,
+        virtualized=None,
+        response_worker=False,
+        skip_aggs_param=None,
+        progressive_search=False,
+        reuse_aggs=False,
+    )
+
+    __slots__ = tuple(default_options)
+
+    feature_defaults = dict(
+        response_cache=dict(max_entries=50, ttl=300),
+        request_debounce=dict(min_delay=50, max_delay=400),
+        prefetch_pages=dict(next=1, previous=0),
+        virtualized=dict(item_height=120, overscan=5, items_per_row=3),
     )
 
     def __init__(self, configuration_options):
@@ -104,11 +347,104 @@ class SearchAppConfig:
             per page.
         :param default_page: An integer setting the default page.
         :param default_max_results: An integer setting the default maximum total results.
+        :param facets: The :class:`FacetsConfig` of the search app.
+        :param sort: The :class:`SortConfig` of the search app.
+        :param initial_filters: Filters applied to the initial query.
+        :param response_cache: Enables the client-side cache of the search
+            responses, either ``True`` or a dictionary with the maximum number
+            of cached responses (``max_entries``) and their time to live in
+            seconds (``ttl``). Responses marked as private are never cached,
+            and the cache is only used in the pages allowed by
+            ``SEARCH_UI_RESPONSE_CACHE``.
+        :param request_debounce: Enables the debouncing of the search requests
+            sent while another one is in flight, either ``True`` or a dictionary
+            with the bounds (in milliseconds) of the delay, which adapts to the
+            latency of the search API (``min_delay`` and ``max_delay``).
+        :param prefetch_pages: Enables the prefetching of the pages around the
+            current one when the browser is idle, either ``True`` or a
+            dictionary with the number of ``next`` and ``previous`` pages.
+        :param batch_endpoint: URL of a multi-search endpoint, through which the
+            initial queries of the search apps of a page are sent together.
+            Each query comes with the headers of its request (e.g. ``Accept``
+            and the ``headers`` of the search API), which the endpoint must
+            apply to it.
+        :param virtualized: Enables the windowed rendering of the results, which
+            only mounts the items near the viewport, either ``True`` or a
+            dictionary with the estimated ``item_height`` (in pixels), the
+            number of items rendered beyond the viewport (``overscan``) and the
+            number of ``items_per_row`` of the grid view.
+        :param response_worker: Boolean enabling the decoding of the search
+            responses in a Web Worker (or on the main thread if the worker
+            cannot be used).
+        :param skip_aggs_param: A ``(name, value)`` pair of query parameter,
+            asking the REST API to skip the aggregations of a search.
+        :param progressive_search: Boolean enabling the progressive search,
+            which fetches the hits first, and then the aggregations in a
+            follow-up request. Requires ``skip_aggs_param``.
+        :param reuse_aggs: Boolean enabling the reuse of the aggregations when
+            only the page, its size or the sorting change, in which case the
+            REST API is asked to skip them. Requires ``skip_aggs_param``.
+        :raises ValueError: If an option is unknown or invalid.
         """
-        options = deepcopy(self.default_options)
-        options.update(configuration_options)
-        for key, value in options.items():
-            setattr(self, key, value)
+        super().__init__(configuration_options)
+
+    def validate(self):
+        """Validate the options."""
+        super().validate()
+        if not self.default_size or self.default_size not in self.pagination_options:
+            raise ValueError(
+                "Parameter default_size should be part of pagination_options"
+            )
+        for key in ("response_worker", "progressive_search", "reuse_aggs"):
+            if not isinstance(getattr(self, key), bool):
+                raise ValueError("Parameter {0} should be a boolean".format(key))
+        if self.skip_aggs_param is not None and (
+            not isinstance(self.skip_aggs_param, (list, tuple))
+            or len(self.skip_aggs_param) != 2
+        ):
+            raise ValueError("Parameter skip_aggs_param should be a (name, value) pair")
+        for key in ("progressive_search", "reuse_aggs"):
+            if getattr(self, key) and not self.skip_aggs_param:
+                raise ValueError("Parameter {0} requires skip_aggs_param".format(key))
+        for feature, defaults in self.feature_defaults.items():
+            options = getattr(self, feature)
+            if not isinstance(options, dict):
+                continue
+            for key, value in options.items():
+                if key not in defaults:
+                    raise ValueError("Unknown {0} parameter: {1}".format(feature, key))
+                if not isinstance(value, int) or value < 0:
+                    raise ValueError(
+                        "Parameter {0}.{1} should be a non-negative integer".format(
+                            feature, key
+                        )
+                    )
+        virtualized = self.feature_options("virtualized")
+        for key in ("item_height", "items_per_row"):
+            if virtualized and virtualized[key] < 1:
+                raise ValueError(
+                    "Parameter virtualized.{0} should be a positive integer".format(key)
+                )
+        debounce = self.feature_options("request_debounce")
+        if debounce and debounce["min_delay"] > debounce["max_delay"]:
+            raise ValueError(
+                "Parameter request_debounce.min_delay should not be greater than "
+                "request_debounce.max_delay"
+            )
+
+    def feature_options(self, feature):
+        """Options of an opt-in feature, merged with their defaults.
+
+        :param feature: Name of the feature option.
+        :returns: The options, or ``None`` if the feature is disabled.
+        """
+        value = getattr(self, feature)
+        if not value:
+            return None
+        options = dict(self.feature_defaults[feature])
+        if isinstance(value, dict):
+            options.update(value)
+        return options
 
     @property
     def appId(self):
@@ -122,7 +458,7 @@ class SearchAppConfig:
             "hiddenParams": self.hidden_params,
             "layout": "list" if self.list_view else "grid",
             "size": self.default_size,
-            "sortBy": self.sort.default,
+            "sortBy": self.sort.default if self.sort is not None else None,
             "page": self.default_page,
             "filters": self.initial_filters,
         }
@@ -130,7 +466,7 @@ class SearchAppConfig:
     @property
     def searchApi(self):
         """Generate searchAPI configuration."""
-        return {
+        search_api = {
             "axios": {
                 "url": self.endpoint,
                 "withCredentials": True,
@@ -140,6 +476,33 @@ class SearchAppConfig:
                 "requestSerializer": "InvenioRecordsResourcesRequestSerializer",
             },
         }
+        if self.skip_aggs_param:
+            name, value = self.skip_aggs_param
+            search_api["skipAggregations"] = {"param": name, "value": value}
+        return search_api
+
+    @property
+    def responseCache(self):
+        """Generate the client-side response cache options."""
+        options = self.feature_options("response_cache")
+        if options is None:
+            return None
+        return {"maxEntries": options["max_entries"], "ttl": options["ttl"]}
+
+    @property
+    def requestDebounce(self):
+        """Generate the search requests debouncing options."""
+        options = self.feature_options("request_debounce")
+        if options is None:
+            return None
+        return {"minDelay": options["min_delay"], "maxDelay": options["max_delay"]}
+
+    @property
+    def batchSearch(self):
+        """Generate the batched search options."""
+        if not self.batch_endpoint:
+            return None
+        return {"url": self.batch_endpoint}
 
     @property
     def layoutOptions(self):
@@ -147,7 +510,15 @@ class SearchAppConfig:
 
         :returns: A dict with the options for React-SearchKit JS.
         """
-        return {"listView": self.list_view, "gridView": self.grid_view}
+        options = {"listView": self.list_view, "gridView": self.grid_view}
+        virtualized = self.feature_options("virtualized")
+        if virtualized is not None:
+            options["virtualized"] = {
+                "itemHeight": virtualized["item_height"],
+                "overscan": virtualized["overscan"],
+                "itemsPerRow": virtualized["items_per_row"],
+            }
+        return options
 
     @property
     def sortOptions(self):
@@ -168,14 +539,7 @@ class SearchAppConfig:
     @property
     def paginationOptions(self):
         """Format the pagination options to be used in React-SearchKit JS."""
-        if (
-            not getattr(self, "default_size")
-            or self.default_size not in self.pagination_options
-        ):
-            raise ValueError(
-                "Parameter default_size should be part of pagination_options"
-            )
-        return {
+        options = {
             "resultsPerPage": [
                 {"text": str(option), "value": option}
                 for option in self.pagination_options
@@ -183,33 +547,66 @@ class SearchAppConfig:
             "defaultValue": self.default_size,
             "maxTotalResults": self.default_max_results,
         }
+        prefetch_pages = self.feature_options("prefetch_pages")
+        if prefetch_pages is not None:
+            options["prefetchPages"] = prefetch_pages
+        return options
 
     @property
     def defaultSortingOnEmptyQueryString(self):
         """Defines the default sorting options when there is no query."""
         return {
-            "sortBy": self.sort.default_no_query,
+            "sortBy": self.sort.default_no_query if self.sort is not None else None,
         }
 
     @classmethod
     def generate(cls, options, **kwargs):
         """Create JSON config for React-Searchkit."""
-        generator_object = cls(options)
-        config = {
-            "appId": generator_object.appId,
-            "initialQueryState": generator_object.initialQueryState,
-            "searchApi": generator_object.searchApi,
-            "sortOptions": generator_object.sortOptions,
-            "aggs": generator_object.aggs,
-            "layoutOptions": generator_object.layoutOptions,
-            "sortOrderDisabled": True,
-            "paginationOptions": generator_object.paginationOptions,
-            "defaultSortingOnEmptyQueryString": (
-                generator_object.defaultSortingOnEmptyQueryString,
-            ),
-        }
-        config.update(kwargs)
-        return config
+        with timed("config"):
+            generator_object = cls(options)
+            config = {
+                "appId": generator_object.appId,
+                "initialQueryState": generator_object.initialQueryState,
+                "searchApi": generator_object.searchApi,
+                "sortOptions": generator_object.sortOptions,
+                "aggs": generator_object.aggs,
+                "layoutOptions": generator_object.layoutOptions,
+                "sortOrderDisabled": True,
+                "paginationOptions": generator_object.paginationOptions,
+                "defaultSortingOnEmptyQueryString": (
+                    generator_object.defaultSortingOnEmptyQueryString,
+                ),
+                "responseCache": generator_object.responseCache,
+                "requestDebounce": generator_object.requestDebounce,
+                "batchSearch": generator_object.batchSearch,
+                "responseWorker": generator_object.response_worker,
+                "progressiveSearch": generator_object.progressive_search,
+                "reuseAggregations": generator_object.reuse_aggs,
+            }
+            config.update(kwargs)
+            return config
+
+
+def response_cache_allowed():
+    """Check if the client-side response cache can be used by the current page.
+
+    It is decided by ``SEARCH_UI_RESPONSE_CACHE``, which defaults to anonymous
+    users only, as the search responses of authenticated users can contain
+    records private to them.
+    """
+    value = current_app.config.get("SEARCH_UI_RESPONSE_CACHE")
+    if not has_request_context():
+        # no page is rendered
+        return value is not False
+    if value is None:
+        return not getattr(current_user, "is_authenticated", False)
+    return bool(value(request) if callable(value) else value)
+
+
+def _config_cache():
+    """Get the configuration cache of the current application, if any."""
+    ext = current_app.extensions.get("invenio-search-ui")
+    return getattr(ext, "config_cache", None)
 
 
 #
@@ -245,7 +642,112 @@ def search_app_config(
 
     Generates search app config expected by React-Searchkit with
     InvenioRecordsResource config.
+
+    The generated config is cached per set of inputs and locale. Each call
+    returns a shallow copy of it, whose top-level keys can be modified, while
+    the nested values are read-only (see :func:`freeze`) and must be replaced
+    rather than modified in place. The client-side response cache is disabled
+    if not allowed for the current request (see
+    :func:`response_cache_allowed`).
     """
+    config = dict(
+        _cached_search_app_config(
+            config_name,
+            available_facets,
+            sort_options,
+            endpoint,
+            headers,
+            overrides,
+            kwargs,
+        )["config"]
+    )
+    if config.get("responseCache") and not response_cache_allowed():
+        config["responseCache"] = None
+    return config
+
+
+def search_app_config_json(
+    config_name,
+    available_facets,
+    sort_options,
+    endpoint,
+    headers,
+    overrides=None,
+    **kwargs,
+):
+    """Search app config serialized as JSON.
+
+    Same as :func:`search_app_config`, but returns the (cached) JSON dump.
+    """
+    entry = _cached_search_app_config(
+        config_name,
+        available_facets,
+        sort_options,
+        endpoint,
+        headers,
+        overrides,
+        kwargs,
+    )
+    key = "json"
+    config = entry["config"]
+    if config.get("responseCache") and not response_cache_allowed():
+        key = "private_json"
+        config = dict(config, responseCache=None)
+    if entry.get(key) is None:
+        with timed("json"):
+            entry[key] = json.dumps(config)
+    return entry[key]
+
+
+@timed("config")
+def _cached_search_app_config(
+    config_name, available_facets, sort_options, endpoint, headers, overrides, kwargs
+):
+    """Get the search app config cache entry, generating it if needed."""
+    cache = _config_cache()
+    if cache is None or cache.maxsize <= 0:
+        return _generate_search_app_config(
+            config_name,
+            available_facets,
+            sort_options,
+            endpoint,
+            headers,
+            overrides,
+            kwargs,
+        )
+
+    key = config_fingerprint(
+        config_name,
+        current_app.config[config_name],
+        definitions_fingerprint(available_facets),
+        definitions_fingerprint(sort_options),
+        endpoint,
+        headers,
+        overrides,
+        kwargs,
+        str(get_locale()),
+    )
+    entry = cache.get(key)
+    if entry is None:
+        entry = _generate_search_app_config(
+            config_name,
+            available_facets,
+            sort_options,
+            endpoint,
+            headers,
+            overrides,
+            kwargs,
+        )
+        # shared between requests
+        entry["config"] = freeze(entry["config"])
+        cache.set(key, entry)
+    return entry
+
+
+def _generate_search_app_config(
+    config_name, available_facets, sort_options, endpoint, headers, overrides, kwargs
+):
+    """Generate a search app config cache entry."""
     opts = dict(
         endpoint=endpoint,
         headers=headers,
@@ -255,4 +757,8 @@ def search_app_config(
     )
     opts.update(kwargs)
     overrides = overrides or {}
-    return SearchAppConfig.generate(opts, **overrides)
+    return {
+        "config": SearchAppConfig.generate(opts, **overrides),
+        "json": None,
+        "private_json": None,
+    }
@@ -0,0 +1,28 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Search UI signals."""
+
+from blinker import Namespace
+
+_signals = Namespace()
+
+search_timing = _signals.signal("search-timing")
+"""Signal sent with the duration of the phases of a timed request.
+
+Requests are timed according to ``SEARCH_UI_TIMING`` and
+``SEARCH_UI_SERVER_TIMING``. The sender is the current application, and the
+durations (in milliseconds) are passed in ``kwargs['timings']``, keyed by
+phase (e.g. ``config``, ``json``, ``render``).
+
+Example subscriber:
+
+.. code-block:: python
+
+    def listener(sender, request=None, timings=None):
+        for phase, duration in timings.items():
+            statsd.timing("search_ui." + phase, duration)
+
+    from invenio_search_ui.signals import search_timing
+    search_timing.connect(listener)
+"""
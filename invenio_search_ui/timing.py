@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Timing of the phases of the search page generation."""
+
+from contextlib import contextmanager
+from time import perf_counter
+
+from flask import current_app, has_request_context, request
+from werkzeug.local import LocalProxy
+
+from .signals import search_timing
+
+
+class _RequestTimings:
+    """Timings of a request."""
+
+    def __init__(self, enabled):
+        """Constructor."""
+        self.enabled = enabled
+        self.active = set()
+        self.durations = {}
+
+
+def _is_enabled(key):
+    """Check if a timing switch is enabled for the current request."""
+    value = current_app.config.get(key)
+    return bool(value(request) if callable(value) else value)
+
+
+def _request_timings():
+    """Get the timings of the current request.
+
+    They are stored in the WSGI environment, as the application context (and
+    thus ``g``) can outlive a request.
+    """
+    if not has_request_context():
+        return None
+    timings = request.environ.get("invenio_search_ui.timings")
+    if timings is None:
+        timings = request.environ["invenio_search_ui.timings"] = _RequestTimings(
+            _is_enabled("SEARCH_UI_TIMING") or _is_enabled("SEARCH_UI_SERVER_TIMING")
+        )
+    return timings
+
+
+def timing_enabled():
+    """Check if the phases of the current request are timed."""
+    timings = _request_timings()
+    return timings is not None and timings.enabled
+
+
+def request_timings():
+    """Durations (in milliseconds) of the timed phases of the current request."""
+    timings = _request_timings()
+    return dict(timings.durations) if timings is not None else {}
+
+
+@contextmanager
+def timed(phase):
+    """Record the duration of a phase of the current request.
+
+    Durations of the same phase are summed up, while nested timings of an
+    already timed phase are ignored. Can also be used as a decorator.
+
+    :param phase: Name of the phase.
+    """
+    timings = _request_timings()
+    if timings is None or not timings.enabled or phase in timings.active:
+        yield
+        return
+
+    timings.active.add(phase)
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        timings.active.discard(phase)
+        timings.durations[phase] = (
+            timings.durations.get(phase, 0) + (perf_counter() - start) * 1000
+        )
+
+
+def time_manifest():
+    """Time the loading of the webpack manifest used by the templates."""
+    manifest = current_app.jinja_env.globals.get("webpack")
+    if not timing_enabled() or not isinstance(manifest, LocalProxy):
+        return
+    with timed("manifest"):
+        try:
+            manifest._get_current_object()
+        except OSError:
+            # the manifest is not built (yet)
+            pass
+
+
+def format_server_timing(timings):
+    """Format durations as a ``Server-Timing`` header value."""
+    return ", ".join(
+        "{0};dur={1:.2f}".format(phase, duration) for phase, duration in timings.items()
+    )
+
+
+def send_timings(response):
+    """Send the timings of the current request and expose them in a header.
+
+    :param response: The response of the current request.
+    :returns: The response, with a ``Server-Timing`` header if enabled.
+    """
+    timings = request_timings()
+    if not timings:
+        return response
+
+    search_timing.send(
+        current_app._get_current_object(), request=request, timings=timings
+    )
+    if _is_enabled("SEARCH_UI_SERVER_TIMING"):
+        response.headers.add("Server-Timing", format_server_timing(timings))
+    return response
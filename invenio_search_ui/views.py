@@ -4,9 +4,33 @@
 
 """UI for Invenio-Search."""
 
-from copy import deepcopy
-
-from flask import Blueprint, current_app, json, render_template
+import os
+from functools import wraps
+
+from flask import (
+    Blueprint,
+    abort,
+    current_app,
+    json,
+    make_response,
+    render_template,
+    request,
+    session,
+    url_for,
+)
+from invenio_base.utils import load_or_import_from_config
+from invenio_i18n import get_locale
+from jinja2 import TemplateNotFound, meta
+from werkzeug.http import is_resource_modified
+
+from .compression import send_precompressed
+from .searchconfig import SearchAppOptions, config_fingerprint, response_cache_allowed
+from .timing import send_timings, time_manifest, timed
+
+try:
+    from flask_login import current_user
+except ImportError:  # pragma: no cover
+    current_user = None
 
 
 def create_blueprint(app):
@@ -19,14 +43,26 @@ def create_blueprint(app):
     )
 
     search_view = app.config.get("SEARCH_UI_SEARCH_VIEW", search)
-    blueprint.add_url_rule("/search", "search", view_func=search_view)
+    blueprint.add_url_rule(
+        "/search", "search", view_func=conditional_search_view(search_view)
+    )
+    blueprint.add_url_rule(
+        "/search/config/<app_id>.json", "search_config", view_func=search_config
+    )
 
     blueprint.add_app_template_filter(format_sortoptions, name="format_sortoptions")
+    blueprint.after_app_request(send_timings)
+    blueprint.before_app_request(send_precompressed)
 
     @blueprint.app_context_processor
     def search_app_helpers():
         """Makes Invenio-Search-JS config generation available for Jinja."""
-        return {"search_app_helpers": current_app.config["SEARCH_UI_SEARCH_CONFIG_GEN"]}
+        return {
+            "search_app_helpers": current_app.config["SEARCH_UI_SEARCH_CONFIG_GEN"],
+            "search_apps": current_app.extensions["invenio-search-ui"].search_apps,
+            "search_app_config_url": search_app_config_url,
+            "search_app_response_cache": response_cache_allowed,
+        }
 
     return blueprint
 
@@ -43,7 +79,373 @@ def search():
     That's the reason why this function is not added to the blueprint here. Instead of that,
     it will be added in the ext.py
     """
-    return render_template(current_app.config["SEARCH_UI_SEARCH_TEMPLATE"])
+    prefetched = prefetch_search_app("search")
+    time_manifest()
+    with timed("render"):
+        return render_template(
+            current_app.config["SEARCH_UI_SEARCH_TEMPLATE"],
+            search_app_prefetch=prefetched,
+        )
+
+
+def conditional_search_view(view):
+    """Answer conditional requests to a search page without rendering it.
+
+    If ``SEARCH_UI_CONDITIONAL_REQUESTS`` is enabled, the page is validated with
+    an ETag (see :class:`SearchPageValidator`), so that ``If-None-Match``
+    requests are answered with a ``304 Not Modified``. Pages rendered with a
+    request dependent context (e.g. for authenticated users) are always
+    rendered in full.
+
+    Views other than :func:`search` (see ``SEARCH_UI_SEARCH_VIEW``) can render
+    any template with any context, so they are only validated if they provide
+    a validator in their ``search_page_validator`` attribute: a callable
+    returning the ETag of the page, or ``None`` if it cannot be validated
+    (e.g. a :class:`SearchPageValidator` of the template they render).
+    """
+    validator = getattr(view, "search_page_validator", None)
+    if validator is None:
+        if view is not search:
+            return view
+        validator = SearchPageValidator()
+
+    @wraps(view)
+    def decorated(*args, **kwargs):
+        if not _is_conditional_request():
+            return view(*args, **kwargs)
+
+        etag = validator()
+        if etag is None:
+            return view(*args, **kwargs)
+        if not is_resource_modified(request.environ, etag=etag):
+            response = current_app.response_class(status=304)
+        else:
+            response = make_response(view(*args, **kwargs))
+        if response.status_code in (200, 304):
+            response.set_etag(etag)
+            response.cache_control.no_cache = True
+            response.vary.update(("Accept-Language", "Cookie"))
+        return response
+
+    decorated.search_page_validator = validator
+    return decorated
+
+
+def _is_conditional_request():
+    """Check if the search page can be validated for the current request."""
+    if not current_app.config["SEARCH_UI_CONDITIONAL_REQUESTS"]:
+        return False
+    if request.method not in ("GET", "HEAD"):
+        return False
+    # the page is rendered with request dependent data
+    if session or current_app.config["SEARCH_UI_PREFETCH_BACKEND"]:
+        return False
+    if getattr(current_user, "is_authenticated", False):
+        return False
+    return True
+
+
+def _mtime(path):
+    """Modification time of a file, if it exists."""
+    try:
+        return os.path.getmtime(path)
+    except (OSError, TypeError):
+        return 0
+
+
+def _template_candidates(env, name):
+    """Names of the templates a template extends, includes or imports.
+
+    Templates referenced with an expression (e.g.
+    ``{% extends config.SEARCH_UI_BASE_TEMPLATE %}``) cannot be resolved
+    statically, so all the templates configured in ``*_TEMPLATE`` variables
+    are considered instead.
+    """
+    source = env.loader.get_source(env, name)[0]
+    names = set(meta.find_referenced_templates(env.parse(source)))
+    if None in names:
+        names.discard(None)
+        names.update(
+            value
+            for key, value in current_app.config.items()
+            if key.endswith("_TEMPLATE") and isinstance(value, str)
+        )
+    return names
+
+
+def _template_chain(name):
+    """Files of a template and of the ones it uses.
+
+    :returns: A sorted list of ``(name, filename)``, or ``None`` if the source
+        of one of the templates is not a file.
+    """
+    env = current_app.jinja_env
+    chain = {}
+    pending = [name]
+    while pending:
+        current = pending.pop()
+        if current in chain:
+            continue
+        try:
+            filename = env.loader.get_source(env, current)[1]
+        except TemplateNotFound:
+            if current == name:
+                raise
+            # e.g. a configured template which is not used
+            continue
+        if filename is None:
+            return None
+        chain[current] = filename
+        pending.extend(_template_candidates(env, current))
+    return sorted(chain.items())
+
+
+class SearchPageValidator:
+    """Compute the ETag of the search page.
+
+    The ETag covers the template of the page and all the templates it uses,
+    the webpack manifest, the compiled search apps, the search UI and records
+    REST configuration (used by pages without registered search app) and the
+    locale. No last modification date is used, as it could not account for
+    all of them.
+
+    Parsing the templates and fingerprinting the configuration is far more
+    expensive than rendering the page, so both are done on first use only:
+    afterwards, the templates are only checked for modification (and resolved
+    again if one of them changed). Call :meth:`reset` if the configuration is
+    changed at runtime.
+
+    :param template: Name of the template of the page (defaults to
+        ``SEARCH_UI_SEARCH_TEMPLATE``).
+    """
+
+    def __init__(self, template=None):
+        """Initialize the validator."""
+        self.template = template
+        self.reset()
+
+    def reset(self):
+        """Forget the resolved templates and configuration."""
+        self._templates = {}
+        self._config = None
+
+    def templates(self, name):
+        """Names and modification times of a template and the ones it uses.
+
+        :returns: A sorted list of ``(name, mtime)``, or ``None`` if the source
+            of one of the templates is not a file.
+        """
+        resolved = self._templates.get(name)
+        if resolved is not None:
+            chain, mtimes = resolved
+            if chain is None:
+                return None
+            current = [(template, _mtime(filename)) for template, filename in chain]
+            if current == mtimes:
+                return current
+
+        chain = _template_chain(name)
+        mtimes = (
+            None
+            if chain is None
+            else [(template, _mtime(filename)) for template, filename in chain]
+        )
+        self._templates[name] = (chain, mtimes)
+        return mtimes
+
+    def config(self):
+        """Fingerprint of the search UI and records REST configuration."""
+        if self._config is None:
+            self._config = config_fingerprint(
+                {
+                    key: value
+                    for key, value in current_app.config.items()
+                    if key.startswith(("SEARCH_UI_", "RECORDS_REST_"))
+                }
+            )
+        return self._config
+
+    def __call__(self):
+        """Compute the ETag of the search page of the current request.
+
+        :returns: The ETag, or ``None`` if the page cannot be validated (e.g.
+            its templates are not loaded from files).
+        """
+        templates = self.templates(
+            self.template or current_app.config["SEARCH_UI_SEARCH_TEMPLATE"]
+        )
+        if templates is None:
+            return None
+
+        manifest_path = current_app.config.get("WEBPACKEXT_MANIFEST_PATH")
+        manifest_mtime = (
+            _mtime(os.path.join(current_app.static_folder, manifest_path))
+            if manifest_path and current_app.static_folder
+            else 0
+        )
+
+        return config_fingerprint(
+            templates,
+            manifest_mtime,
+            current_app.extensions["invenio-search-ui"].search_apps.fingerprint,
+            self.config(),
+            str(get_locale()),
+        )
+
+
+def search_config(app_id):
+    """Serve the configuration of a registered search app.
+
+    The response is validated with a content hash ETag. When requested with
+    the current hash as ``v`` query argument (see
+    :func:`search_app_config_url`), the URL is immutable and the response can
+    be cached for ``SEARCH_UI_CONFIG_MAX_AGE`` seconds.
+    """
+    search_apps = current_app.extensions["invenio-search-ui"].search_apps
+    if app_id not in search_apps:
+        abort(404)
+
+    search_app = search_apps[app_id]
+    etag = search_app.etag()
+    response = current_app.response_class(
+        search_app.json(), mimetype="application/json"
+    )
+    response.set_etag(etag)
+    if request.args.get("v") == etag:
+        response.cache_control.public = True
+        response.cache_control.max_age = current_app.config["SEARCH_UI_CONFIG_MAX_AGE"]
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+        response.vary.update(("Accept-Language", "Cookie"))
+    return response.make_conditional(request)
+
+
+def search_app_config_url(name):
+    """Versioned URL of the configuration of a registered search app.
+
+    If ``SEARCH_UI_PREBUILT_CONFIGS`` is enabled, the URL of the prebuilt
+    static file is used when available.
+    """
+    search_apps = current_app.extensions["invenio-search-ui"].search_apps
+    if current_app.config["SEARCH_UI_PREBUILT_CONFIGS"]:
+        filename = search_apps.prebuilt_file(name)
+        if filename is not None:
+            return url_for("static", filename=filename)
+    search_app = search_apps[name]
+    return url_for("invenio_search_ui.search_config", app_id=name, v=search_app.etag())
+
+
+URL_QUERY_ARGS = {
+    "q": "queryString",
+    "sort": "sortBy",
+    "order": "sortOrder",
+    "p": "page",
+    "s": "size",
+    "f": "filters",
+}
+"""Query state keys of the search page URL arguments (see React-SearchKit)."""
+
+
+def _url_filter(value):
+    """Parse a filter URL argument, e.g. ``type:publication+subtype:article``."""
+    parent, dummy_separator, child = value.partition("+")
+    field, separator, term = parent.partition(":")
+    if not separator:
+        return None
+    if not child:
+        return [field, term]
+    child = _url_filter(child)
+    return None if child is None else [field, term, child]
+
+
+def url_query(args):
+    """Query state encoded in the URL of a search page.
+
+    The arguments are parsed like the URL handler of React-SearchKit, which
+    restores the query state of the search app from the URL (e.g.
+    ``?q=test&sort=newest&p=2&s=20&f=type:publication``). Invalid values are
+    ignored, as they are by React-SearchKit.
+
+    :param args: The query arguments of the request.
+    :returns: The query state, or ``None`` if a filter cannot be parsed.
+    """
+    query = {}
+    for arg, key in URL_QUERY_ARGS.items():
+        if arg not in args:
+            continue
+        value = args[arg]
+        if key == "filters":
+            filters = [_url_filter(value) for value in args.getlist(arg)]
+            if None in filters:
+                return None
+            query[key] = filters
+        elif key in ("page", "size"):
+            if value.isdigit() and int(value) > 0:
+                query[key] = int(value)
+        elif key == "sortOrder":
+            if value in ("asc", "desc"):
+                query[key] = value
+        else:
+            query[key] = value
+    return query
+
+
+def initial_query(config, args=None):
+    """Query state of the first search issued by a search app.
+
+    :param config: A generated React-SearchKit configuration.
+    :param args: The query arguments of the search page URL (see
+        :func:`url_query`).
+    :returns: The initial query state, with the default sorting on empty query
+        string applied, or ``None`` if the URL arguments cannot be parsed.
+    """
+    url_state = url_query(args or {})
+    if url_state is None:
+        return None
+    query = dict(config.get("initialQueryState") or {})
+    query.update(url_state)
+    query.setdefault("queryString", "")
+    sorting = config.get("defaultSortingOnEmptyQueryString")
+    if (
+        not query["queryString"]
+        and "sortBy" not in url_state
+        and isinstance(sorting, dict)
+    ):
+        query.update({k: v for k, v in sorting.items() if v is not None})
+    return query
+
+
+def prefetch_search_app(name):
+    """Run the initial query of a registered search app on the server.
+
+    The query is executed by the callable configured in
+    ``SEARCH_UI_PREFETCH_BACKEND``, so that the response can be embedded in
+    the search page next to the search app configuration. The query state is
+    restored from the URL of the page, like the search app does.
+
+    :param name: Name of the search app in ``SEARCH_UI_SEARCH_APPS``.
+    :returns: A dictionary with the executed ``query`` and the ``response``, or
+        ``None`` if prefetching is disabled or failed.
+    """
+    backend = load_or_import_from_config("SEARCH_UI_PREFETCH_BACKEND")
+    search_apps = current_app.extensions["invenio-search-ui"].search_apps
+    if backend is None or name not in search_apps:
+        return None
+
+    config = search_apps.config(name)
+    query = initial_query(config, request.args)
+    if query is None:
+        return None
+    try:
+        with timed("prefetch"):
+            response = backend(config, query)
+    except Exception:
+        current_app.logger.exception("Prefetching search app '%s' failed.", name)
+        return None
+    if response is None:
+        return None
+    return {"query": query, "response": response}
 
 
 def sorted_options(sort_options):
@@ -62,7 +464,7 @@ def sorted_options(sort_options):
     ]
 
 
-class SearchAppInvenioRestConfigHelper(object):
+class SearchAppInvenioRestConfigHelper(SearchAppOptions):
     """Configuration generator for Invenio-Search-JS.
 
     Using the existing configuration from Invenio-Records-REST we can
@@ -80,8 +482,11 @@ class SearchAppInvenioRestConfigHelper(object):
         pagination_options=(10, 20, 50),
         default_size=10,
         default_page=1,
+        additional_headers=None,
     )
 
+    __slots__ = tuple(default_options) + ("_rest_config",)
+
     def __init__(self, configuration_options):
         """Initialize the search configuration.
 
@@ -98,11 +503,21 @@ class SearchAppInvenioRestConfigHelper(object):
         :param default_size: An integer setting the default number of results
             per page.
         :param default_page: An integer setting the default page.
+        :param additional_headers: Dictionary containing headers to be added to
+            the default ``Accept`` header of the endpoint.
+        :raises ValueError: If an option is unknown or invalid.
+        :raises KeyError: If the endpoint is not configured.
         """
-        options = deepcopy(self.default_options)
-        options.update(configuration_options)
-        for key, value in options.items():
-            setattr(self, key, value)
+        super().__init__(configuration_options)
+        self._rest_config = current_app.config["RECORDS_REST_ENDPOINTS"][
+            self.endpoint_id
+        ]
+
+    def validate(self):
+        """Validate the options."""
+        super().validate()
+        if not self.default_size or self.default_size not in self.pagination_options:
+            raise ValueError("Parameter default_size should be part of options")
 
     def _sort_config(self, search_index, option):
         """Returns the sort by and sort order for a given index and option.
@@ -123,11 +538,6 @@ class SearchAppInvenioRestConfigHelper(object):
 
         return sort_by, sort_order
 
-    @property
-    def _rest_config(self):
-        """Get endpoint configuration."""
-        return current_app.config["RECORDS_REST_ENDPOINTS"][self.endpoint_id]
-
     @property
     def appId(self):
         """."""
@@ -153,7 +563,7 @@ class SearchAppInvenioRestConfigHelper(object):
     def searchApi(self):
         """Generate searchAPI configuration."""
         headers = {"Accept": self._rest_config["default_media_type"]}
-        headers.update(getattr(self, "additional_headers", {}))
+        headers.update(self.additional_headers or {})
         return {
             "axios": {
                 "url": "/api{}".format(self._rest_config["list_route"]),
@@ -219,11 +629,6 @@ class SearchAppInvenioRestConfigHelper(object):
         :returns: A list of dicts with the appropriate format
          for React-SearchKit JS.
         """
-        if (
-            not getattr(self, "default_size")
-            or self.default_size not in self.pagination_options
-        ):
-            raise ValueError("Parameter default_size should be part of options")
         return {
             "resultsPerPage": [
                 {"text": str(option), "value": option}
@@ -242,18 +647,19 @@ class SearchAppInvenioRestConfigHelper(object):
     @classmethod
     def generate(cls, options, **kwargs):
         """Create JSON config for Invenio-Search-JS with InvenioREST config."""
-        generator_object = cls(options)
-        config = {
-            "appId": generator_object.appId,
-            "initialQueryState": generator_object.initialQueryState,
-            "searchApi": generator_object.searchApi,
-            "sortOptions": generator_object.sortOptions,
-            "aggs": generator_object.aggs,
-            "layoutOptions": generator_object.layoutOptions,
-            "paginationOptions": generator_object.paginationOptions,
-            "defaultSortingOnEmptyQueryString": (
-                generator_object.defaultSortingOnEmptyQueryString
-            ),
-        }
-        config.update(kwargs)
-        return config
+        with timed("config"):
+            generator_object = cls(options)
+            config = {
+                "appId": generator_object.appId,
+                "initialQueryState": generator_object.initialQueryState,
+                "searchApi": generator_object.searchApi,
+                "sortOptions": generator_object.sortOptions,
+                "aggs": generator_object.aggs,
+                "layoutOptions": generator_object.layoutOptions,
+                "paginationOptions": generator_object.paginationOptions,
+                "defaultSortingOnEmptyQueryString": (
+                    generator_object.defaultSortingOnEmptyQueryString
+                ),
+            }
+            config.update(kwargs)
+            return config
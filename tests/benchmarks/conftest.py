@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+r"""Pytest configuration for the benchmarks.
+
+The benchmarks only run the benchmarked functions once during the normal test
+run (``--benchmark-disable``). To time them, save a baseline and compare
+against it later, failing on regressions:
+
+.. code-block:: console
+
+    $ pytest tests/benchmarks --benchmark-enable --benchmark-autosave
+    $ pytest tests/benchmarks --benchmark-enable --benchmark-compare \
+        --benchmark-compare-fail=mean:15%
+"""
+
+import pytest
+
+
+class Facet:
+    """Minimal facet with a label."""
+
+    def __init__(self, label):
+        """Constructor."""
+        self._label = label
+
+
+def make_facets(count):
+    """Generate facet definitions, every other one with a nested facet."""
+    facets = {}
+    for i in range(count):
+        ui = {"field": "field_{0}".format(i)}
+        if i % 2:
+            ui["childAgg"] = {
+                "field": "field_{0}.sub".format(i),
+                "childAgg": {"field": "field_{0}.sub.sub".format(i)},
+            }
+        facets["facet_{0}".format(i)] = {
+            "facet": Facet("Facet {0}".format(i)),
+            "ui": ui,
+        }
+    return facets
+
+
+def make_sort_options(count):
+    """Generate sort option definitions."""
+    return {
+        "sort_{0}".format(i): {
+            "title": "Sort {0}".format(i),
+            "order": count - i,
+            "default_order": "desc" if i % 2 else "asc",
+        }
+        for i in range(count)
+    }
+
+
+@pytest.fixture()
+def facets():
+    """Hundreds of facet definitions."""
+    return make_facets(300)
+
+
+@pytest.fixture()
+def sort_options():
+    """Sort option definitions."""
+    return make_sort_options(50)
+
+
+@pytest.fixture()
+def search_config(app, facets, sort_options):
+    """Search app configuration block selecting all facets and sort options."""
+    app.config["BENCHMARK_SEARCH"] = {
+        "facets": list(facets),
+        "sort": list(sort_options),
+    }
+    return app.config["BENCHMARK_SEARCH"]
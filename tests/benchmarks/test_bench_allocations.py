@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Allocation benchmarks of the search app configuration generation."""
+
+import tracemalloc
+from copy import deepcopy
+
+import pytest
+
+from invenio_search_ui.searchconfig import FacetsConfig, SearchAppConfig, SortConfig
+
+pytestmark = pytest.mark.benchmark(group="allocations")
+
+
+class DeepCopyFacetsConfig(FacetsConfig):
+    """Facets mapping copying the whole UI definition, as a reference."""
+
+    def map_option(self, key, option):
+        """Generate an RSK aggregation option from a deep copy."""
+        title = option.get("title", option["facet"]._label)
+        ui = deepcopy(option["ui"])
+        ui.update({"aggName": key, "title": title})
+        if "childAgg" in ui:
+            ui["childAgg"].setdefault("aggName", "inner")
+            ui["childAgg"].setdefault("title", title)
+        return ui
+
+
+def _allocated(func, *args):
+    """Peak size (in bytes) of the memory allocated by a call."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _generate(facets_config_cls, facets, sort_options):
+    """Generate a full React-SearchKit configuration."""
+    return SearchAppConfig.generate(
+        dict(
+            endpoint="/api/records",
+            sort=SortConfig(sort_options, list(sort_options)),
+            facets=facets_config_cls(facets, list(facets)),
+        )
+    )
+
+
+def test_generate_allocations(benchmark, facets, sort_options):
+    """Generating the configuration allocates less than deep copying it."""
+    # definitions are frozen on first use
+    _generate(FacetsConfig, facets, sort_options)
+
+    frozen = _allocated(_generate, FacetsConfig, facets, sort_options)
+    copied = _allocated(_generate, DeepCopyFacetsConfig, facets, sort_options)
+    benchmark.extra_info.update(allocated=frozen, allocated_deepcopy=copied)
+
+    config = benchmark(_generate, FacetsConfig, facets, sort_options)
+    assert config == _generate(DeepCopyFacetsConfig, facets, sort_options)
+    assert frozen < copied
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Benchmarks of the search app configuration generation."""
+
+import pytest
+
+from invenio_search_ui.searchconfig import (
+    FacetsConfig,
+    SearchAppConfig,
+    SortConfig,
+    search_app_config,
+)
+from invenio_search_ui.views import format_sortoptions, sorted_options
+
+pytestmark = pytest.mark.benchmark(group="searchconfig")
+
+
+def test_facets_map_option(benchmark, facets):
+    """Map hundreds of (nested) facets."""
+    config = FacetsConfig(facets, list(facets))
+    aggs = benchmark(list, config)
+    assert len(aggs) == len(facets)
+    assert aggs[1]["childAgg"]["aggName"] == "inner"
+
+
+def test_sort_config(benchmark, sort_options):
+    """Iterate over the sort options."""
+    config = SortConfig(sort_options, list(sort_options))
+    options = benchmark(list, config)
+    assert len(options) == len(sort_options)
+
+
+def test_sorted_options(benchmark, sort_options):
+    """Sort the sort options for display."""
+    options = benchmark(sorted_options, sort_options)
+    assert options[0]["title"] == "Sort 49"
+
+
+def test_format_sortoptions(benchmark, sort_options):
+    """Dump the sort options for Invenio-Search-JS."""
+    assert benchmark(format_sortoptions, sort_options)
+
+
+def test_search_app_config_generate(benchmark, facets, sort_options):
+    """Generate a full React-SearchKit configuration."""
+
+    def generate():
+        return SearchAppConfig.generate(
+            dict(
+                endpoint="/api/records",
+                headers={"Accept": "application/json"},
+                sort=SortConfig(sort_options, list(sort_options)),
+                facets=FacetsConfig(facets, list(facets)),
+            )
+        )
+
+    config = benchmark(generate)
+    assert len(config["aggs"]) == len(facets)
+
+
+@pytest.mark.parametrize("cache_size", [0, 128], ids=["uncached", "cached"])
+def test_search_app_config(
+    benchmark, app, search_config, facets, sort_options, cache_size
+):
+    """Generate the configuration through the (cached) context helper."""
+    app.extensions["invenio-search-ui"].config_cache.maxsize = cache_size
+    with app.test_request_context():
+        config = benchmark(
+            search_app_config,
+            "BENCHMARK_SEARCH",
+            facets,
+            sort_options,
+            "/api/records",
+            {"Accept": "application/json"},
+        )
+    assert len(config["aggs"]) == len(facets)
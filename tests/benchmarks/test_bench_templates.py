@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Benchmarks of the search page rendering."""
+
+import pytest
+from flask import render_template_string
+
+pytestmark = pytest.mark.benchmark(group="templates")
+
+
+def _render(template):
+    """Render a search page template without its assets."""
+    return render_template_string("""
+        {%% extends '%s' %%}
+        {%% block javascript %%}{%% endblock %%}
+        {%% block css %%}{%% endblock %%}
+        {%% block page_body %%}{{ super() }}{%% endblock %%}
+        """ % template)
+
+
+def test_render_ng_search(benchmark, app):
+    """Render the AngularJS/Bootstrap3 search page."""
+    with app.test_request_context():
+        rendered = benchmark(_render, "invenio_search_ui/search.html")
+    assert "invenio-search-results" in rendered
+
+
+def test_render_rsk_search(benchmark, app, use_records_rest_config):
+    """Render the React-SearchKit/Semantic-UI search page."""
+    with app.test_request_context():
+        rendered = benchmark(_render, "semantic-ui/invenio_search_ui/search.html")
+    assert "data-invenio-search-config" in rendered
+
+
+def test_render_rsk_search_registered(benchmark, app, use_records_rest_config):
+    """Render the React-SearchKit/Semantic-UI search page of a registered app."""
+    app.config["SEARCH_UI_SEARCH_APPS"] = {
+        "search": {
+            "generator": "invenio_records_rest",
+            "options": {"endpoint_id": "recid"},
+        },
+    }
+    with app.test_request_context():
+        rendered = benchmark(_render, "semantic-ui/invenio_search_ui/search.html")
+    assert "data-invenio-search-config" in rendered
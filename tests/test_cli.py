@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the command line interface."""
+
+import json
+import os
+
+import pytest
+
+from invenio_search_ui.cli import build_configs
+from invenio_search_ui.views import search_app_config_url
+
+
+@pytest.fixture()
+def search_apps(app, use_records_rest_config, instance_path):
+    """Declare a search app, with a temporary static folder."""
+    app.static_folder = instance_path
+    app.config["SEARCH_UI_SEARCH_TEMPLATE"] = "invenio_search_ui/search_rsk.html"
+    app.config["I18N_LANGUAGES"] = [("de", "German")]
+    app.config["SEARCH_UI_SEARCH_APPS"] = {
+        "search": {
+            "generator": "invenio_records_rest",
+            "options": {"endpoint_id": "recid", "app_id": "search"},
+        },
+    }
+    return app.extensions["invenio-search-ui"].search_apps
+
+
+def test_build_configs(app, search_apps, instance_path):
+    """Test prebuilding the search app configurations."""
+    output_dir = os.path.join(instance_path, "search-ui", "configs")
+    result = app.test_cli_runner().invoke(build_configs)
+    assert result.exit_code == 0, result.output
+
+    with open(os.path.join(output_dir, "manifest.json")) as fp:
+        manifest = json.load(fp)
+    assert manifest["fingerprint"] == search_apps.fingerprint
+    files = manifest["apps"]["search"]
+    assert sorted(files) == ["de", "en"]
+    with open(os.path.join(output_dir, files["en"])) as fp:
+        dump = fp.read()
+    assert dump == search_apps.json("search", locale="en")
+    assert " " not in dump.split('"url"')[0]
+    assert search_apps["search"].etag(locale="en")[:16] in files["en"]
+
+    app.config["SEARCH_UI_PREBUILT_CONFIGS"] = True
+    with app.test_request_context():
+        url = search_app_config_url("search")
+    assert url == "/static/search-ui/configs/{0}".format(files["en"])
+    with app.test_client() as client:
+        html = client.get("/search").get_data(as_text=True)
+    assert 'data-invenio-search-config-url="{0}"'.format(url) in html
+
+
+def test_build_configs_outdated(app, search_apps):
+    """Test that outdated prebuilt configurations are not used."""
+    result = app.test_cli_runner().invoke(build_configs, ["--locale", "en"])
+    assert result.exit_code == 0, result.output
+
+    app.config["SEARCH_UI_PREBUILT_CONFIGS"] = True
+    app.config["SEARCH_UI_SEARCH_APPS"]["search"]["options"]["default_size"] = 20
+    search_apps.compile()
+    search_apps._prebuilt = None
+    with app.test_request_context():
+        assert search_apps.prebuilt is None
+        assert search_app_config_url("search").startswith("/search/config/")
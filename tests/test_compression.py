@@ -0,0 +1,185 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the precompressed static files."""
+
+import gzip
+import json
+import os
+
+import pytest
+
+from invenio_search_ui.cli import compress_assets
+from invenio_search_ui.compression import search_ui_static_files
+
+TEMPLATE = "templates/invenio_search_ui/results.html"
+
+ASSETS = (
+    "js/invenio_search_ui_app.abc.js",
+    "js/vendor.abc.js",
+    "js/123.abc.js",
+    "js/other_app.abc.js",
+)
+
+CONTENT = b"<div ng-repeat='record in vm.invenioSearchResults.hits.hits'></div>\n" * 50
+
+
+def _write(path, content):
+    """Write a file, creating its directory."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as fp:
+        fp.write(content)
+
+
+@pytest.fixture()
+def static_files(app, instance_path):
+    """Search UI static files, in a temporary static folder."""
+    app.static_folder = instance_path
+    app.config["WEBPACKEXT_PROJECT_DISTDIR"] = os.path.join(instance_path, "dist")
+    _write(os.path.join(instance_path, TEMPLATE), CONTENT)
+    for name in ASSETS:
+        _write(os.path.join(instance_path, "dist", name), b"console.log('js');\n" * 50)
+    manifest = {
+        "status": "done",
+        "assets": {name: {"name": name} for name in ASSETS},
+        "chunks": {
+            "invenio_search_ui_app": [
+                "js/vendor.abc.js",
+                "js/invenio_search_ui_app.abc.js",
+            ],
+            "other_app": ["js/vendor.abc.js", "js/other_app.abc.js"],
+        },
+    }
+    _write(
+        os.path.join(instance_path, "dist", "manifest.json"),
+        json.dumps(manifest).encode(),
+    )
+    return instance_path
+
+
+def test_compress_assets(app, static_files):
+    """Test writing the precompressed variants of the search UI files."""
+    result = app.test_cli_runner().invoke(compress_assets)
+    assert result.exit_code == 0, result.output
+
+    template = os.path.join(static_files, TEMPLATE)
+    with open(template + ".gz", "rb") as fp:
+        assert gzip.decompress(fp.read()) == CONTENT
+    # the files of the search UI entry and the lazy chunks are compressed
+    for name in ASSETS[:-1]:
+        assert os.path.exists(os.path.join(static_files, "dist", name + ".gz"))
+    # but not the ones of other entries
+    assert not os.path.exists(
+        os.path.join(static_files, "dist", "js", "other_app.abc.js.gz")
+    )
+
+    # compressing again does not compress the variants themselves
+    result = app.test_cli_runner().invoke(compress_assets)
+    assert result.exit_code == 0, result.output
+    assert not os.path.exists(template + ".gz.gz")
+
+
+def test_send_precompressed(app, static_files):
+    """Test serving the precompressed variants."""
+    app.test_cli_runner().invoke(compress_assets)
+    url = "/static/" + TEMPLATE
+
+    with app.test_client() as client:
+        # disabled by default
+        res = client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert res.status_code == 200
+        assert res.content_encoding is None
+
+        app.config["SEARCH_UI_PRECOMPRESSED_ASSETS"] = True
+        res = client.get(url, headers={"Accept-Encoding": "gzip, deflate"})
+        assert res.status_code == 200
+        assert res.content_encoding == "gzip"
+        assert res.mimetype == "text/html"
+        assert "Accept-Encoding" in res.vary
+        assert gzip.decompress(res.data) == CONTENT
+
+        res = client.get(url, headers={"Accept-Encoding": "gzip;q=0, deflate"})
+        assert res.content_encoding is None
+        assert "Accept-Encoding" in res.vary
+        assert res.data == CONTENT
+
+        res = client.get(url)
+        assert res.content_encoding is None
+        assert res.data == CONTENT
+
+        # only the search UI files are served precompressed
+        _write(
+            os.path.join(static_files, "dist", "js", "other_app.abc.js.gz"),
+            gzip.compress(CONTENT),
+        )
+        res = client.get(
+            "/static/dist/js/other_app.abc.js", headers={"Accept-Encoding": "gzip"}
+        )
+        assert res.status_code == 200
+        assert res.content_encoding is None
+
+        # files without variants are served as usual
+        os.remove(os.path.join(static_files, "dist", "js", "other_app.abc.js.gz"))
+        res = client.get(
+            "/static/dist/js/other_app.abc.js", headers={"Accept-Encoding": "gzip"}
+        )
+        assert res.status_code == 200
+        assert res.content_encoding is None
+        assert "Accept-Encoding" not in res.vary
+
+        res = client.get("/static/missing.js", headers={"Accept-Encoding": "gzip"})
+        assert res.status_code == 404
+
+
+def test_send_precompressed_outdated(app, static_files):
+    """Test that variants older than their file are not served."""
+    app.test_cli_runner().invoke(compress_assets)
+    app.config["SEARCH_UI_PRECOMPRESSED_ASSETS"] = True
+    template = os.path.join(static_files, TEMPLATE)
+    mtime = os.path.getmtime(template + ".gz")
+    os.utime(template, (mtime + 10, mtime + 10))
+
+    with app.test_client() as client:
+        res = client.get("/static/" + TEMPLATE, headers={"Accept-Encoding": "gzip"})
+        assert res.content_encoding is None
+        assert res.data == CONTENT
+
+
+def test_send_precompressed_brotli(app, static_files):
+    """Test that brotli is preferred when accepted."""
+    brotli = pytest.importorskip("brotli")
+    app.test_cli_runner().invoke(compress_assets)
+    app.config["SEARCH_UI_PRECOMPRESSED_ASSETS"] = True
+
+    with app.test_client() as client:
+        res = client.get("/static/" + TEMPLATE, headers={"Accept-Encoding": "gzip, br"})
+        assert res.content_encoding == "br"
+        assert brotli.decompress(res.data) == CONTENT
+
+
+def test_search_ui_static_files_without_manifest(app, static_files):
+    """Test that the webpack outputs are only found with a manifest."""
+    os.remove(os.path.join(static_files, "dist", "manifest.json"))
+    assert search_ui_static_files(app) == [os.path.join(static_files, TEMPLATE)]
+
+
+def test_search_ui_static_files_rebuild(app, static_files):
+    """Test that the files are found again after a webpack build."""
+    files = app.extensions["invenio-search-ui"].static_files
+    assert TEMPLATE in files
+    assert "dist/js/invenio_search_ui_app.def.js" not in files
+
+    _write(
+        os.path.join(static_files, "dist", "js", "invenio_search_ui_app.def.js"),
+        b"console.log('js');\n",
+    )
+    manifest_path = os.path.join(static_files, "dist", "manifest.json")
+    _write(
+        manifest_path,
+        json.dumps(
+            {"chunks": {"invenio_search_ui_app": ["js/invenio_search_ui_app.def.js"]}}
+        ).encode(),
+    )
+    mtime = os.path.getmtime(manifest_path)
+    os.utime(manifest_path, (mtime + 10, mtime + 10))
+    assert "dist/js/invenio_search_ui_app.def.js" in files
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the registry of search apps."""
+
+import json
+
+import pytest
+from flask import render_template_string
+
+from invenio_search_ui.ext import finalize_app
+from invenio_search_ui.views import SearchAppInvenioRestConfigHelper
+
+
+@pytest.fixture()
+def search_apps(app, use_records_rest_config):
+    """Declare a search app."""
+    app.config["SEARCH_UI_SEARCH_APPS"] = {
+        "search": {
+            "generator": "invenio_records_rest",
+            "options": {"endpoint_id": "recid", "app_id": "search"},
+            "overrides": {"extra": True},
+        },
+    }
+    return app.extensions["invenio-search-ui"].search_apps
+
+
+def test_compile(app, search_apps):
+    """Test that the declared search apps are compiled."""
+    finalize_app(app)
+    assert list(search_apps) == ["search"]
+
+    with app.test_request_context():
+        expected = SearchAppInvenioRestConfigHelper.generate(
+            {"endpoint_id": "recid", "app_id": "search"}, extra=True
+        )
+        assert json.loads(search_apps.json("search")) == expected
+        assert search_apps.config("search") == expected
+        # the compiled config is not shared with callers
+        search_apps.config("search")["appId"] = "changed"
+        assert search_apps.config("search")["appId"] == "search"
+
+        rendered = render_template_string("""
+            {% extends 'semantic-ui/invenio_search_ui/search.html' %}
+            {% block javascript %}{% endblock %}
+            {% block css %}{% endblock %}
+            {% block page_body %}{{ super() }}{% endblock %}
+            """)
+    assert "data-invenio-search-config" in rendered
+    assert "extra" in rendered
+
+
+def test_compile_lazily(app, search_apps):
+    """Test that the search apps are compiled on first access."""
+    assert "search" in search_apps
+    assert search_apps["search"].fingerprint
+    assert search_apps.fingerprint
+
+
+@pytest.mark.parametrize(
+    "definition",
+    [
+        {
+            "generator": "invenio_records_rest",
+            "options": {"endpoint_id": "recid", "default_size": 15},
+        },
+        {"generator": "invenio_records_rest", "options": {"endpoint_id": "unknown"}},
+        {"generator": "unknown", "options": {}},
+    ],
+)
+def test_compile_invalid(app, use_records_rest_config, definition):
+    """Test that misconfigured search apps fail at startup."""
+    app.config["SEARCH_UI_SEARCH_APPS"] = {"invalid": definition}
+    with pytest.raises(ValueError) as e:
+        finalize_app(app)
+    assert "invalid" in str(e.value)
@@ -0,0 +1,354 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the React-SearchKit search app configuration."""
+
+import json
+
+import pytest
+
+from invenio_search_ui.searchconfig import (
+    FacetsConfig,
+    FrozenDict,
+    SearchAppConfig,
+    SearchAppConfigCache,
+    config_fingerprint,
+    freeze,
+    search_app_config,
+    search_app_config_json,
+)
+
+
+class Facet:
+    """Minimal facet with a label."""
+
+    def __init__(self, label):
+        """Constructor."""
+        self._label = label
+
+
+FACETS = {
+    "type": {"facet": Facet("Type"), "ui": {"field": "type"}},
+    "subject": {
+        "facet": Facet("Subject"),
+        "ui": {"field": "subject", "childAgg": {"field": "subject.sub"}},
+    },
+}
+
+SORT_OPTIONS = {
+    "bestmatch": {"title": "Best match"},
+    "newest": {"title": "Newest"},
+}
+
+
+@pytest.fixture()
+def search_config(app):
+    """Search app configuration block."""
+    app.config["TEST_SEARCH"] = {
+        "facets": ["type", "subject"],
+        "sort": ["bestmatch", "newest"],
+    }
+    return app.config["TEST_SEARCH"]
+
+
+def _config(**kwargs):
+    """Generate the test search app config."""
+    return search_app_config(
+        "TEST_SEARCH", FACETS, SORT_OPTIONS, "/api/records", {}, **kwargs
+    )
+
+
+def test_search_app_config(app, search_config):
+    """Test the generated search app config."""
+    with app.test_request_context():
+        config = _config()
+    assert config["appId"] == "search"
+    assert config["searchApi"]["axios"]["url"] == "/api/records"
+    assert config["initialQueryState"]["sortBy"] == "bestmatch"
+    assert list(config["sortOptions"]) == [
+        {"sortBy": "bestmatch", "text": "Best match"},
+        {"sortBy": "newest", "text": "Newest"},
+    ]
+    assert config["aggs"][0] == {"field": "type", "aggName": "type", "title": "Type"}
+    assert config["aggs"][1]["childAgg"] == {
+        "field": "subject.sub",
+        "aggName": "inner",
+        "title": "Subject",
+    }
+    # the facet definitions are left untouched
+    assert FACETS["subject"]["ui"] == {
+        "field": "subject",
+        "childAgg": {"field": "subject.sub"},
+    }
+
+
+def test_search_app_config_cache(app, search_config):
+    """Test that generated configs are cached until their inputs change."""
+    cache = app.extensions["invenio-search-ui"].config_cache
+    with app.test_request_context():
+        config = _config()
+        assert _config() == config
+        assert len(cache) == 1
+
+        # callers get their own copy of the cached config, whose nested
+        # values are read-only
+        url = config["searchApi"]["axios"]["url"]
+        with pytest.raises(TypeError):
+            config["searchApi"]["axios"]["url"] = "/changed"
+        config["searchApi"] = dict(
+            config["searchApi"], axios=dict(config["searchApi"]["axios"], url="/x")
+        )
+        config["initialQueryState"] = {"filters": [["type", "publication"]]}
+        fresh = _config()
+        assert fresh["searchApi"]["axios"]["url"] == url
+        assert fresh["initialQueryState"]["filters"] == ()
+        assert len(cache) == 1
+
+        # other arguments produce another config
+        assert _config(app_id="other")["appId"] == "other"
+        assert len(cache) == 2
+
+        # changing the application config invalidates the entry
+        search_config["sort"] = ["newest", "bestmatch"]
+        changed = _config()
+        assert changed["initialQueryState"]["sortBy"] == "newest"
+
+        assert json.loads(
+            search_app_config_json(
+                "TEST_SEARCH", FACETS, SORT_OPTIONS, "/api/records", {}
+            )
+        ) == json.loads(json.dumps(changed))
+
+
+def test_search_app_config_cache_disabled(app, search_config):
+    """Test that the cache can be disabled."""
+    cache = app.extensions["invenio-search-ui"].config_cache
+    cache.maxsize = 0
+    with app.test_request_context():
+        assert _config() is not _config()
+    assert len(cache) == 0
+
+
+def test_config_cache_eviction():
+    """Test the LRU eviction of the cache."""
+    cache = SearchAppConfigCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_config_fingerprint():
+    """Test the configuration fingerprint."""
+    assert config_fingerprint({"a": 1, "b": [1, 2]}) == config_fingerprint(
+        {"b": [1, 2], "a": 1}
+    )
+    assert config_fingerprint({"a": 1}) != config_fingerprint({"a": 2})
+    assert config_fingerprint({1, 2}) == config_fingerprint({2, 1})
+
+
+def test_freeze():
+    """Test the read-only structures."""
+    frozen = freeze({"a": [1, {"b": 2}]})
+    assert frozen == {"a": (1, {"b": 2})}
+    assert isinstance(frozen["a"][1], FrozenDict)
+    assert json.loads(json.dumps(frozen)) == {"a": [1, {"b": 2}]}
+    with pytest.raises(TypeError):
+        frozen["a"] = 1
+    with pytest.raises(TypeError):
+        frozen["a"][1].update(b=3)
+    assert freeze(frozen) is frozen
+
+
+def test_facets_config_shares_definitions():
+    """Test that the nested facet definitions are frozen once and shared."""
+    first, second = list(FacetsConfig(FACETS, ["subject"])), list(
+        FacetsConfig(FACETS, ["subject"])
+    )
+    assert first == second
+    assert first[0] is not second[0]
+    assert first[0]["childAgg"] is second[0]["childAgg"]
+    with pytest.raises(TypeError):
+        first[0]["childAgg"]["title"] = "Changed"
+
+
+def test_search_app_config_validation():
+    """Test the validation of the search app options at construction."""
+    config = SearchAppConfig({"endpoint": "/api/records"})
+    assert not hasattr(config, "__dict__")
+    assert config.paginationOptions["defaultValue"] == 10
+
+    with pytest.raises(ValueError, match="Unknown search app options: foo"):
+        SearchAppConfig({"foo": "bar"})
+    with pytest.raises(ValueError, match="default_size"):
+        SearchAppConfig({"default_size": 15})
+    with pytest.raises(ValueError, match="grid_view"):
+        SearchAppConfig({"grid_view": "yes"})
+
+
+def test_search_app_config_response_cache(app, search_config):
+    """Test the client-side response cache option."""
+    assert _config()["responseCache"] is None
+    assert _config(response_cache=True)["responseCache"] == {
+        "maxEntries": 50,
+        "ttl": 300,
+    }
+    assert _config(response_cache={"ttl": 60})["responseCache"] == {
+        "maxEntries": 50,
+        "ttl": 60,
+    }
+
+    with pytest.raises(ValueError, match="response_cache.ttl"):
+        SearchAppConfig({"response_cache": {"ttl": -1}})
+    with pytest.raises(ValueError, match="Unknown response_cache parameter"):
+        SearchAppConfig({"response_cache": {"size": 10}})
+
+
+def test_search_app_config_response_cache_per_request(app, search_config):
+    """Test that the response cache can be disabled per request."""
+    options = dict(response_cache=True)
+    with app.test_request_context():
+        # anonymous users
+        assert _config(**options)["responseCache"]
+
+        app.config["SEARCH_UI_RESPONSE_CACHE"] = lambda request: False
+        assert _config(**options)["responseCache"] is None
+        dump = search_app_config_json(
+            "TEST_SEARCH", FACETS, SORT_OPTIONS, "/api/records", {}, **options
+        )
+        assert json.loads(dump)["responseCache"] is None
+
+        # the cached config is not affected
+        app.config["SEARCH_UI_RESPONSE_CACHE"] = True
+        assert _config(**options)["responseCache"]
+        dump = search_app_config_json(
+            "TEST_SEARCH", FACETS, SORT_OPTIONS, "/api/records", {}, **options
+        )
+        assert json.loads(dump)["responseCache"]
+
+
+def test_search_app_config_request_debounce(app, search_config):
+    """Test the search requests debouncing option."""
+    assert _config()["requestDebounce"] is None
+    assert _config(request_debounce={"max_delay": 200})["requestDebounce"] == {
+        "minDelay": 50,
+        "maxDelay": 200,
+    }
+    with pytest.raises(ValueError, match="min_delay should not be greater"):
+        SearchAppConfig({"request_debounce": {"min_delay": 500, "max_delay": 10}})
+    with pytest.raises(ValueError, match="min_delay should not be greater"):
+        SearchAppConfig({"request_debounce": {"min_delay": 500}})
+
+
+def test_search_app_config_prefetch_pages(app, search_config):
+    """Test the prefetching of the next result pages."""
+    assert "prefetchPages" not in _config()["paginationOptions"]
+    pagination = _config(prefetch_pages={"previous": 1})["paginationOptions"]
+    assert pagination["prefetchPages"] == {"next": 1, "previous": 1}
+    assert pagination["maxTotalResults"] == 10000
+
+
+def test_search_app_config_batch_search(app, search_config):
+    """Test the batched search option."""
+    assert _config()["batchSearch"] is None
+    config = _config(batch_endpoint="/api/_msearch")
+    assert config["batchSearch"] == {"url": "/api/_msearch"}
+
+
+def test_search_app_config_virtualized(app, search_config):
+    """Test the windowed rendering of the results."""
+    assert _config()["layoutOptions"] == {"listView": True, "gridView": False}
+    layout = _config(virtualized={"overscan": 10})["layoutOptions"]
+    assert layout["virtualized"] == {
+        "itemHeight": 120,
+        "overscan": 10,
+        "itemsPerRow": 3,
+    }
+    # no overscan is fine, but rows need a height and items
+    assert _config(virtualized={"overscan": 0})["layoutOptions"]["virtualized"]
+    with pytest.raises(ValueError, match="virtualized.item_height"):
+        SearchAppConfig({"virtualized": {"item_height": 0}})
+    with pytest.raises(ValueError, match="virtualized.items_per_row"):
+        SearchAppConfig({"virtualized": {"items_per_row": 0}})
+
+
+def test_search_app_config_response_worker(app, search_config):
+    """Test the decoding of the search responses in a Web Worker."""
+    assert _config()["responseWorker"] is False
+    assert _config(response_worker=True)["responseWorker"] is True
+    with pytest.raises(ValueError, match="response_worker"):
+        SearchAppConfig({"response_worker": "yes"})
+
+
+def test_facets_config_paging():
+    """Test the paged facets declared in the UI options."""
+    facets = {
+        "subject": {
+            "facet": Facet("Subject"),
+            "ui": {"field": "subject", "paging": True},
+        },
+        "affiliation": {
+            "facet": Facet("Affiliation"),
+            "ui": {"field": "affiliation", "paging": {"size": 5, "param": "aff"}},
+        },
+    }
+    subject, affiliation = FacetsConfig(facets, ["subject", "affiliation"])
+    assert subject["paging"] == {"size": 10, "param": None}
+    assert affiliation["paging"] == {"size": 5, "param": "aff"}
+
+    facets["subject"] = dict(facets["subject"], ui={"paging": {"size": 0}})
+    with pytest.raises(ValueError, match="paging size"):
+        list(FacetsConfig(facets, ["subject"]))
+
+
+def test_search_app_config_progressive_search(app, search_config):
+    """Test the progressive search option."""
+    config = _config()
+    assert config["progressiveSearch"] is False
+    assert "skipAggregations" not in config["searchApi"]
+
+    config = _config(skip_aggs_param=("aggs", "false"), progressive_search=True)
+    assert config["progressiveSearch"] is True
+    assert config["searchApi"]["skipAggregations"] == {
+        "param": "aggs",
+        "value": "false",
+    }
+
+    with pytest.raises(ValueError, match="requires skip_aggs_param"):
+        SearchAppConfig({"progressive_search": True})
+    with pytest.raises(ValueError, match="pair"):
+        SearchAppConfig({"skip_aggs_param": ("aggs",)})
+    with pytest.raises(ValueError, match="skip_aggs_param"):
+        SearchAppConfig({"skip_aggs_param": "ab"})
+    # e.g. loaded from JSON
+    assert SearchAppConfig({"skip_aggs_param": ["aggs", "false"]}).searchApi[
+        "skipAggregations"
+    ] == {"param": "aggs", "value": "false"}
+
+
+def test_search_app_config_reuse_aggs(app, search_config):
+    """Test the reuse of the aggregations option."""
+    assert _config()["reuseAggregations"] is False
+    config = _config(skip_aggs_param=("aggs", "false"), reuse_aggs=True)
+    assert config["reuseAggregations"] is True
+
+    with pytest.raises(ValueError, match="reuse_aggs requires skip_aggs_param"):
+        SearchAppConfig({"reuse_aggs": True})
+
+
+def test_facets_config_lazy_child_agg():
+    """Test the lazy nested facets declared in the UI options."""
+    facets = {
+        "subject": {
+            "facet": Facet("Subject"),
+            "ui": {"field": "subject", "childAgg": {"field": "sub", "lazy": True}},
+        },
+    }
+    (subject,) = FacetsConfig(facets, ["subject"])
+    assert subject["childAgg"]["lazy"] == {"param": None}
+    assert subject["childAgg"]["aggName"] == "inner"
+    assert "lazy" not in list(FacetsConfig(FACETS, ["subject"]))[0]["childAgg"]
@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the timing of the search page generation."""
+
+import pytest
+
+from invenio_search_ui.signals import search_timing
+from invenio_search_ui.timing import format_server_timing, request_timings, timed
+
+
+@pytest.fixture()
+def search_page(app, use_records_rest_config):
+    """Render the search page of a registered search app."""
+    app.config.update(
+        SEARCH_UI_SEARCH_TEMPLATE="invenio_search_ui/search_rsk.html",
+        SEARCH_UI_SEARCH_APPS={
+            "search": {
+                "generator": "invenio_records_rest",
+                "options": {"endpoint_id": "recid"},
+            },
+        },
+    )
+
+
+@pytest.fixture()
+def timings():
+    """Record the timings sent with the signal."""
+    received = []
+
+    def listener(sender, request=None, timings=None):
+        received.append(timings)
+
+    search_timing.connect(listener)
+    yield received
+    search_timing.disconnect(listener)
+
+
+def test_server_timing(app, search_page, timings):
+    """Test the Server-Timing header."""
+    app.config["SEARCH_UI_SERVER_TIMING"] = True
+    with app.test_client() as client:
+        res = client.get("/search")
+    header = res.headers["Server-Timing"]
+    assert "render;dur=" in header
+    assert len(timings) == 1
+    assert "render" in timings[0]
+
+
+def test_timing_signal_only(app, search_page, timings):
+    """Test that timings can be recorded without exposing them."""
+    app.config["SEARCH_UI_TIMING"] = lambda request: "timed" in request.args
+    with app.test_client() as client:
+        assert "Server-Timing" not in client.get("/search?timed=1").headers
+        assert len(timings) == 1
+        client.get("/search")
+        assert len(timings) == 1
+
+
+def test_timing_disabled(app, search_page, timings):
+    """Test that nothing is recorded by default."""
+    with app.test_client() as client:
+        assert "Server-Timing" not in client.get("/search").headers
+    assert timings == []
+
+
+def test_timed(app):
+    """Test that nested phases are only timed once."""
+    app.config["SEARCH_UI_TIMING"] = True
+    with app.test_request_context():
+        with timed("config"):
+            with timed("config"):
+                pass
+            with timed("json"):
+                pass
+        durations = request_timings()
+    assert set(durations) == {"config", "json"}
+    assert durations["config"] >= durations["json"]
+
+
+def test_format_server_timing():
+    """Test the Server-Timing header format."""
+    assert (
+        format_server_timing({"config": 1.234, "render": 2})
+        == "config;dur=1.23, render;dur=2.00"
+    )
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the bundling of the JavaScript translations."""
+
+import os
+import re
+
+import invenio_search_ui
+
+MESSAGES_DIR = os.path.join(
+    os.path.dirname(invenio_search_ui.__file__),
+    "assets",
+    "semantic-ui",
+    "translations",
+    "invenio_search_ui",
+    "messages",
+)
+
+STATIC_IMPORT = re.compile(r'^import .* from "(?P<path>[^"]+)";$', re.M)
+DYNAMIC_IMPORT = re.compile(r'import\(\s*(?:/\*.*?\*/\s*)?"(?P<path>[^"]+)"\s*\)')
+
+
+def _generated_translations():
+    """Read the generated translations index."""
+    with open(os.path.join(MESSAGES_DIR, "_generatedTranslations.js")) as f:
+        return f.read()
+
+
+def _compiled_languages():
+    """Languages with a compiled catalog."""
+    return {
+        lang
+        for lang in os.listdir(MESSAGES_DIR)
+        if os.path.isfile(os.path.join(MESSAGES_DIR, lang, "translations.json"))
+    }
+
+
+def test_only_fallback_catalog_is_bundled():
+    """Test that only the English catalog is imported in the search app bundle.
+
+    Each statically imported catalog adds to the entry chunk downloaded on
+    every search page.
+    """
+    source = _generated_translations()
+    assert [m.group("path") for m in STATIC_IMPORT.finditer(source)] == [
+        "./en/translations.json"
+    ]
+
+
+def test_catalogs_are_loaded_on_demand():
+    """Test that every other compiled catalog is loaded in its own chunk."""
+    source = _generated_translations()
+    loaded = {m.group("path").split("/")[1] for m in DYNAMIC_IMPORT.finditer(source)}
+    assert loaded == _compiled_languages() - {"en"}
+    for lang in loaded:
+        assert 'webpackChunkName: "invenio_search_ui_i18n_{0}"'.format(lang) in source
@@ -0,0 +1,318 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the search views."""
+
+import json
+import os
+from html import unescape
+from unittest import mock
+
+import jinja2
+import pytest
+from werkzeug.datastructures import MultiDict
+
+from invenio_search_ui.views import (
+    SearchPageValidator,
+    _template_chain,
+    conditional_search_view,
+    initial_query,
+    prefetch_search_app,
+    search_app_config_url,
+    url_query,
+)
+
+
+@pytest.fixture()
+def search_apps(app, use_records_rest_config):
+    """Declare the default search app rendered by the search view."""
+    app.config.update(
+        SEARCH_UI_SEARCH_TEMPLATE="invenio_search_ui/search_rsk.html",
+        SEARCH_UI_SEARCH_APPS={
+            "search": {
+                "generator": "invenio_records_rest",
+                "options": {"endpoint_id": "recid"},
+            },
+        },
+    )
+    return app.extensions["invenio-search-ui"].search_apps
+
+
+@pytest.fixture()
+def prefetch_backend(app):
+    """Stub prefetch backend recording its calls."""
+    calls = []
+
+    def backend(config, query):
+        calls.append((config, query))
+        return {"hits": {"hits": [{"id": "1"}], "total": 1}, "aggregations": {}}
+
+    app.config["SEARCH_UI_PREFETCH_BACKEND"] = backend
+    return calls
+
+
+def _data_attribute(html, name):
+    """Extract and decode a JSON data attribute from the rendered page."""
+    start = html.index("{0}='".format(name)) + len(name) + 2
+    return json.loads(unescape(html[start : html.index("'", start)]))
+
+
+def test_initial_query():
+    """Test the initial query of a search app."""
+    config = {
+        "initialQueryState": {"sortBy": "bestmatch", "page": 1, "size": 10},
+        "defaultSortingOnEmptyQueryString": {"sortBy": "newest"},
+    }
+    assert initial_query(config) == {
+        "queryString": "",
+        "sortBy": "newest",
+        "page": 1,
+        "size": 10,
+    }
+    config["initialQueryState"]["queryString"] = "test"
+    assert initial_query(config)["sortBy"] == "bestmatch"
+
+
+def test_initial_query_url_args():
+    """Test that the initial query is restored from the URL arguments."""
+    config = {
+        "initialQueryState": {"sortBy": "bestmatch", "page": 1, "size": 10},
+        "defaultSortingOnEmptyQueryString": {"sortBy": "newest"},
+    }
+    args = MultiDict(
+        [
+            ("q", "title:test"),
+            ("p", "2"),
+            ("s", "abc"),
+            ("order", "desc"),
+            ("l", "grid"),
+            ("f", "type:publication+subtype:article"),
+            ("f", "access:open"),
+        ]
+    )
+    assert initial_query(config, args) == {
+        "queryString": "title:test",
+        "sortBy": "bestmatch",
+        "sortOrder": "desc",
+        "page": 2,
+        "size": 10,
+        "filters": [
+            ["type", "publication", ["subtype", "article"]],
+            ["access", "open"],
+        ],
+    }
+    # an explicit sorting wins over the default sorting on empty query
+    assert initial_query(config, MultiDict({"sort": "title"}))["sortBy"] == "title"
+    assert url_query(MultiDict({"f": "publication"})) is None
+    assert initial_query(config, MultiDict({"f": "publication"})) is None
+
+
+def test_search_prefetch(app, search_apps, prefetch_backend):
+    """Test that the initial results are embedded in the search page."""
+    with app.test_client() as client:
+        html = client.get("/search").get_data(as_text=True)
+
+    assert len(prefetch_backend) == 1
+    config, query = prefetch_backend[0]
+    assert config["appId"] == "search"
+    assert query == initial_query(config)
+
+    prefetched = _data_attribute(html, "data-invenio-search-prefetch")
+    assert prefetched["query"] == query
+    assert prefetched["response"]["hits"]["total"] == 1
+    assert _data_attribute(html, "data-invenio-search-config") == config
+
+
+def test_search_prefetch_url_args(app, search_apps, prefetch_backend):
+    """Test that the query of the URL is prefetched."""
+    with app.test_client() as client:
+        html = client.get("/search?q=test&p=2").get_data(as_text=True)
+        config, query = prefetch_backend[0]
+        assert query["queryString"] == "test"
+        assert query["page"] == 2
+        assert _data_attribute(html, "data-invenio-search-prefetch")["query"] == query
+
+        # queries which cannot be restored are not prefetched
+        html = client.get("/search?f=invalid").get_data(as_text=True)
+        assert len(prefetch_backend) == 1
+        assert "data-invenio-search-prefetch" not in html
+
+
+def test_search_prefetch_disabled(app, search_apps):
+    """Test that nothing is prefetched without a backend."""
+    with app.test_client() as client:
+        html = client.get("/search").get_data(as_text=True)
+    assert "data-invenio-search-config" in html
+    assert "data-invenio-search-prefetch" not in html
+
+
+def test_search_prefetch_failure(app, search_apps):
+    """Test that a failing backend does not break the search page."""
+
+    def backend(config, query):
+        raise RuntimeError("search cluster unavailable")
+
+    app.config["SEARCH_UI_PREFETCH_BACKEND"] = backend
+    with app.test_request_context():
+        assert prefetch_search_app("search") is None
+        assert prefetch_search_app("unknown") is None
+
+
+def test_search_config(app, search_apps):
+    """Test the search app configuration endpoint."""
+    with app.test_client() as client:
+        res = client.get("/search/config/search.json")
+        assert res.status_code == 200
+        assert res.json["appId"] == "search"
+        assert res.cache_control.no_cache
+        etag = res.headers["ETag"].strip('"')
+
+        # revalidation
+        res = client.get(
+            "/search/config/search.json", headers={"If-None-Match": '"%s"' % etag}
+        )
+        assert res.status_code == 304
+
+        # versioned URLs are cached
+        with app.test_request_context():
+            url = search_app_config_url("search")
+        assert url == "/search/config/search.json?v={0}".format(etag)
+        res = client.get(url)
+        assert res.cache_control.public
+        assert res.cache_control.max_age == app.config["SEARCH_UI_CONFIG_MAX_AGE"]
+
+        assert client.get("/search/config/unknown.json").status_code == 404
+
+
+def test_search_response_cache(app, search_apps):
+    """Test that the page can disable the client-side response cache."""
+    with app.test_client() as client:
+        html = client.get("/search").get_data(as_text=True)
+        assert "data-invenio-search-response-cache" not in html
+
+        app.config["SEARCH_UI_RESPONSE_CACHE"] = False
+        html = client.get("/search").get_data(as_text=True)
+        assert 'data-invenio-search-response-cache="false"' in html
+
+
+def test_search_config_url(app, search_apps):
+    """Test that the search page references the configuration endpoint."""
+    app.config["SEARCH_UI_CONFIG_URL"] = True
+    with app.test_client() as client:
+        html = client.get("/search").get_data(as_text=True)
+    assert "data-invenio-search-config-url" in html
+    assert "data-invenio-search-config=" not in html
+
+
+def test_search_conditional_requests(app, search_apps):
+    """Test that the search page answers conditional requests."""
+    app.config["SEARCH_UI_CONDITIONAL_REQUESTS"] = True
+    with app.test_client() as client:
+        res = client.get("/search")
+        assert res.status_code == 200
+        etag = res.headers["ETag"]
+        assert "Last-Modified" not in res.headers
+
+        res = client.get("/search", headers={"If-None-Match": etag})
+        assert res.status_code == 304
+        assert res.headers["ETag"] == etag
+        assert not res.data
+
+        # the page is only validated with its ETag
+        res = client.get(
+            "/search", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+        )
+        assert res.status_code == 200
+
+        # another locale or configuration changes the validator
+        app.config["SEARCH_UI_SEARCH_APPS"]["other"] = dict(
+            app.config["SEARCH_UI_SEARCH_APPS"]["search"]
+        )
+        search_apps.compile()
+        res = client.get("/search", headers={"If-None-Match": etag})
+        assert res.status_code == 200
+        etag = res.headers["ETag"]
+
+        # the configuration is only read once
+        app.config["RECORDS_REST_DEFAULT_SORT"] = {}
+        res = client.get("/search", headers={"If-None-Match": etag})
+        assert res.status_code == 304
+        app.view_functions["invenio_search_ui.search"].search_page_validator.reset()
+        res = client.get("/search", headers={"If-None-Match": etag})
+        assert res.status_code == 200
+        etag = res.headers["ETag"]
+
+        # the templates are only resolved again when one of them changes
+        with mock.patch(
+            "invenio_search_ui.views._template_chain", wraps=_template_chain
+        ) as template_chain:
+            res = client.get("/search", headers={"If-None-Match": etag})
+            assert res.status_code == 304
+            assert not template_chain.called
+
+        # so do changes of the parent templates
+        base = os.path.join(
+            os.path.dirname(__file__), "templates", "invenio_search_ui", "base.html"
+        )
+        mtime = os.path.getmtime(base)
+        try:
+            os.utime(base, (mtime + 10, mtime + 10))
+            res = client.get("/search", headers={"If-None-Match": etag})
+            assert res.status_code == 200
+        finally:
+            os.utime(base, (mtime, mtime))
+
+
+def test_search_conditional_requests_unknown_template(app, search_apps):
+    """Test that pages with templates not loaded from files are not validated."""
+    app.config["SEARCH_UI_CONDITIONAL_REQUESTS"] = True
+    app.config["SEARCH_UI_SEARCH_TEMPLATE"] = "search_dict.html"
+    app.jinja_loader = jinja2.ChoiceLoader(
+        [
+            jinja2.DictLoader(
+                {"search_dict.html": "{% extends 'invenio_search_ui/base.html' %}"}
+            ),
+            app.jinja_loader,
+        ]
+    )
+    with app.test_client() as client:
+        res = client.get("/search")
+        assert res.status_code == 200
+        assert "ETag" not in res.headers
+
+
+def test_search_conditional_requests_custom_view(app, search_apps):
+    """Test that custom search views are only validated with their validator."""
+    app.config["SEARCH_UI_CONDITIONAL_REQUESTS"] = True
+
+    def custom_search():
+        return "custom"
+
+    assert conditional_search_view(custom_search) is custom_search
+
+    custom_search.search_page_validator = SearchPageValidator(
+        "invenio_search_ui/search_rsk.html"
+    )
+    view = conditional_search_view(custom_search)
+    with app.test_request_context("/search"):
+        res = view()
+        assert res.get_data(as_text=True) == "custom"
+        etag = res.headers["ETag"]
+    with app.test_request_context("/search", headers={"If-None-Match": etag}):
+        assert view().status_code == 304
+
+
+def test_search_conditional_requests_fallback(app, search_apps, prefetch_backend):
+    """Test that request dependent pages are always rendered."""
+    app.config["SEARCH_UI_CONDITIONAL_REQUESTS"] = True
+    with app.test_client() as client:
+        res = client.get("/search")
+        assert res.status_code == 200
+        assert "ETag" not in res.headers
+        assert len(prefetch_backend) == 1
+
+
+def test_search_conditional_requests_disabled(app, search_apps):
+    """Test that the search page is not validated by default."""
+    with app.test_client() as client:
+        assert "ETag" not in client.get("/search").headers